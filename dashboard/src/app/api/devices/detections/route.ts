@@ -45,6 +45,27 @@ function logDetectionEvent(eventId: string, deviceId: string, action: string, de
   }
 }
 
+// Accepts either a JSON payload or multipart/form-data with a JSON
+// "metadata" part and a raw "image" part, which skips base64 on the wire
+async function parseDetectionPayload(request: NextRequest): Promise<DetectionPayload> {
+  const contentType = request.headers.get('content-type') || ''
+  if (!contentType.startsWith('multipart/form-data')) {
+    return request.json()
+  }
+
+  const form = await request.formData()
+  const metadataPart = form.get('metadata')
+  const payload: DetectionPayload = JSON.parse(
+    typeof metadataPart === 'string' ? metadataPart : await (metadataPart as Blob).text()
+  )
+
+  const imagePart = form.get('image')
+  if (imagePart && typeof imagePart !== 'string') {
+    payload.image_base64 = Buffer.from(await imagePart.arrayBuffer()).toString('base64')
+  }
+  return payload
+}
+
 export async function POST(request: NextRequest) {
   try {
     const authResult = verifyRequest(request)
@@ -55,7 +76,7 @@ export async function POST(request: NextRequest) {
       )
     }
 
-    const body: DetectionPayload = await request.json()
+    const body = await parseDetectionPayload(request)
     const { 
       event_id,
       detection_id, 
@@ -0,0 +1,52 @@
+import { NextRequest, NextResponse } from 'next/server'
+import { verifyRequest } from '@/lib/auth'
+import { applyHeartbeat } from '@/lib/heartbeat'
+
+export async function POST(request: NextRequest) {
+  try {
+    const authResult = verifyRequest(request)
+    if (!authResult.valid) {
+      return NextResponse.json(
+        { success: false, error: 'Unauthorized' },
+        { status: 401 }
+      )
+    }
+
+    const body = await request.json()
+    const { heartbeats } = body
+
+    if (!Array.isArray(heartbeats)) {
+      return NextResponse.json(
+        { success: false, error: 'Missing required fields' },
+        { status: 400 }
+      )
+    }
+
+    let acceptedCount = 0
+    let rejectedCount = 0
+
+    for (const heartbeat of heartbeats) {
+      if (!heartbeat?.device_id) {
+        rejectedCount++
+        continue
+      }
+
+      applyHeartbeat(heartbeat)
+      acceptedCount++
+    }
+
+    return NextResponse.json({ 
+      success: true, 
+      message: `${acceptedCount} heartbeats received`,
+      timestamp: Date.now(),
+      count: acceptedCount,
+      rejected: rejectedCount
+    })
+  } catch (error) {
+    console.error('Error processing batch heartbeats:', error)
+    return NextResponse.json(
+      { success: false, error: 'Failed to process heartbeats' },
+      { status: 500 }
+    )
+  }
+}
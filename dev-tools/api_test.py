@@ -11,12 +11,52 @@ import json
 import time
 import random
 import argparse
-import base64
+import asyncio
+import threading
+import itertools
+import mmap
+import gzip
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple
-import urllib.request
-import urllib.error
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+import http.client
+import urllib.parse
+
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib codec
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+
+def _splice(payload: bytes, key: bytes, fragment: bytes) -> bytes:
+    """Append ``"key": fragment`` to a serialized, non-empty JSON object."""
+    return payload[:-1] + b',"' + key + b'":' + fragment + b"}"
+
+
+try:
+    import numpy as np
+
+    _np_rng = np.random.default_rng()
+except ImportError:
+    _np_rng = None
+
+# Millisecond-seeded and shared by every tester in the process, so event
+# IDs stay unique across a fleet even when devices start in the same millisecond
+_ID_COUNTER = itertools.count(int(time.time() * 1000))
 
 
 # ANSI colors for terminal output
@@ -32,6 +72,54 @@ class Colors:
     END = "\033[0m"
 
 
+# Constant banners and report fragments, formatted once at import time
+_RULE = "═══════════════════════════════════════════════════════"
+
+
+def _banner(title: str) -> str:
+    return (
+        f"\n{Colors.BOLD}{Colors.HEADER}{_RULE}{Colors.END}\n"
+        f"{Colors.BOLD}{Colors.HEADER}     {title}{Colors.END}\n"
+        f"{Colors.BOLD}{Colors.HEADER}{_RULE}{Colors.END}\n"
+    )
+
+
+_RUN_ALL_BANNER = _banner("OPTIC-SHIELD API Test Suite - Full Run")
+_EMULATION_BANNER = _banner("OPTIC-SHIELD Device Emulation")
+_FLEET_BANNER = _banner("OPTIC-SHIELD Fleet Emulation")
+_MENU = (
+    _banner("OPTIC-SHIELD API Testing Suite")
+    + f"\n{Colors.BOLD}Select an option:{Colors.END}\n"
+    + f"  {Colors.CYAN}1.{Colors.END} Test Device Registration API\n"
+    + f"  {Colors.CYAN}2.{Colors.END} Test Heartbeat API\n"
+    + f"  {Colors.CYAN}3.{Colors.END} Test Detection API\n"
+    + f"  {Colors.CYAN}4.{Colors.END} Test Device List API (GET)\n"
+    + f"  {Colors.CYAN}5.{Colors.END} Test Detection Logs API (GET)\n"
+    + f"  {Colors.GREEN}6.{Colors.END} Run ALL Tests\n"
+    + f"  {Colors.YELLOW}7.{Colors.END} Emulate Device to Production Portal\n"
+    + f"  {Colors.RED}0.{Colors.END} Exit\n"
+    + f"\n{Colors.BOLD}{_RULE}{Colors.END}\n"
+)
+_REPORT_HEADER = (
+    f"\n{Colors.BOLD}{_RULE}{Colors.END}\n"
+    f"{Colors.BOLD}                    TEST REPORT{Colors.END}\n"
+    f"{Colors.BOLD}{_RULE}{Colors.END}\n"
+)
+_REPORT_RULE = "─" * 60 + "\n"
+_REPORT_COLUMNS = f"\n{'Test':<30} {'Status':<10} {'Code':<8} {'Time':<10}\n" + _REPORT_RULE
+_ROW_FMT = "{name:<30} {status:<18} {code:<8} {rt:.0f}ms\n".format
+_STATUS_PASS = f"{Colors.GREEN}PASS{Colors.END}"
+_STATUS_FAIL = f"{Colors.RED}FAIL{Colors.END}"
+_SUMMARY_PASS = (
+    f"\n{Colors.GREEN}{Colors.BOLD}✓ Summary: {{passed}}/{{total}} tests passed{Colors.END}\n"
+    f"{Colors.BOLD}{_RULE}{Colors.END}\n\n"
+)
+_SUMMARY_FAIL = (
+    f"\n{Colors.RED}{Colors.BOLD}✗ Summary: {{passed}}/{{total}} tests passed{Colors.END}\n"
+    f"{Colors.BOLD}{_RULE}{Colors.END}\n\n"
+)
+
+
 # Test configuration
 DEFAULT_DEVICE_ID = f"test-{random.randint(1000,9999)}"
 WILD_CAT_SPECIES = [
@@ -47,6 +135,134 @@ WILD_CAT_SPECIES = [
 ]
 
 
+# Status icons used by the emulation log, formatted once at import time
+_ICON_OK = f"{Colors.GREEN}✓{Colors.END}"
+_ICON_FAIL = f"{Colors.RED}✗{Colors.END}"
+_SPECIES_FMT = f"{Colors.YELLOW}%s{Colors.END}"
+
+
+def _load_base64_cached(path: Path) -> bytes:
+    """Return the base64 encoding of a file, cached in a sidecar next to it.
+
+    The cache lives at ``<name>.b64`` with a ``<name>.b64.key`` file holding
+    the source's mtime and size; a matching key skips re-encoding entirely.
+    Failing to write the cache (e.g. a read-only checkout) is not an error.
+    """
+    stat = path.stat()
+    key = f"{stat.st_mtime_ns}-{stat.st_size}"
+    cache_path = path.with_name(path.name + ".b64")
+    key_path = path.with_name(path.name + ".b64.key")
+
+    try:
+        if key_path.read_text() == key:
+            return cache_path.read_bytes()
+    except OSError:
+        pass
+
+    # Encode straight from the page cache; no file-sized read buffer
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        encoded = base64.b64encode(mm)
+
+    try:
+        # Write the payload before the key so a torn update is never trusted
+        for target, data in ((cache_path, encoded), (key_path, key.encode())):
+            tmp_path = target.with_name(target.name + ".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, target)
+    except OSError:
+        pass
+    return encoded
+
+
+class _LineBuffer:
+    """Collects log lines and writes them to stdout in batches.
+
+    Output is flushed once ``max_lines`` are pending or ``max_delay`` seconds
+    have passed since the last write, so slow loops still print promptly
+    while tight loops avoid a write per line.
+    """
+
+    def __init__(self, max_lines: int = 16, max_delay: float = 0.5):
+        self.max_lines = max_lines
+        self.max_delay = max_delay
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def write(self, line: str):
+        with self._lock:
+            self._lines.append(line)
+            if (
+                len(self._lines) >= self.max_lines
+                or time.monotonic() - self._last_flush >= self.max_delay
+            ):
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._lines:
+            sys.stdout.write("".join(self._lines))
+            sys.stdout.flush()
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+
+_emulation_log = _LineBuffer()
+
+
+class _RandomPool:
+    """Hands out pre-drawn random numbers in ``[low, high]``, refilled in batches.
+
+    Used by the emulation loop so each tick indexes into a buffer instead of
+    calling the PRNG; batches come from NumPy when it is installed.
+    """
+
+    def __init__(self, low: float, high: float, integer: bool = False, size: int = 4096):
+        self.low = low
+        self.high = high
+        self.integer = integer
+        self.size = size
+        self._values = iter(())
+
+    def _refill(self):
+        if _np_rng is not None:
+            if self.integer:
+                batch = _np_rng.integers(self.low, self.high + 1, self.size)
+            else:
+                batch = _np_rng.uniform(self.low, self.high, self.size)
+            # tolist() yields native Python numbers the JSON encoders accept
+            self._values = iter(batch.tolist())
+        else:
+            draw = random.randint if self.integer else random.uniform
+            self._values = iter([draw(self.low, self.high) for _ in range(self.size)])
+
+    def next(self):
+        try:
+            return next(self._values)
+        except StopIteration:
+            self._refill()
+            return next(self._values)
+
+
+class _ChoicePool:
+    """Hands out pre-drawn picks from ``population``, refilled in batches."""
+
+    def __init__(self, population: List[Any], size: int = 1024):
+        self.population = population
+        self.size = size
+        self._values = iter(())
+
+    def next(self):
+        try:
+            return next(self._values)
+        except StopIteration:
+            self._values = iter(random.choices(self.population, k=self.size))
+            return next(self._values)
+
+
 class TestResult:
     """Represents a single test result."""
 
@@ -71,13 +287,124 @@ class TestResult:
 class APITester:
     """Testing suite for OPTIC-SHIELD Dashboard APIs."""
 
-    def __init__(self, base_url: str, api_key: str, device_id: str = DEFAULT_DEVICE_ID):
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        device_id: str = DEFAULT_DEVICE_ID,
+        demo_image: Optional[bytes] = None,
+        retain_results: bool = True,
+        compress_requests: bool = False,
+    ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.device_id = device_id
+        self._cam_id = f"cam-{device_id}"
+        self._test_device_name = f"Test-Device-{device_id}"
+        self._id_counter = _ID_COUNTER
         self.results: List[TestResult] = []
-        self._demo_image: Optional[str] = None
-        self._load_demo_image()
+        self.retain_results = retain_results
+        # Opt-in: the dashboard must accept Content-Encoding: gzip bodies
+        self.compress_requests = compress_requests
+        self._passed_count = 0
+        self._total_count = 0
+        self._emulation: Optional["_EmulationState"] = None
+        self._demo_image_bytes: Optional[bytes] = None
+        self._demo_image_json: Optional[bytes] = None
+        if demo_image is not None:
+            # Shared by an existing tester, e.g. when emulating a fleet
+            self._demo_image_bytes = demo_image
+            self._demo_image_json = b'"' + demo_image + b'"'
+        else:
+            self._load_demo_image()
+
+        # One keep-alive connection is reused for every request so the
+        # TCP/TLS handshake is paid once rather than per call.
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._base_path = parts.path
+        conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._conn = conn_cls(parts.hostname, parts.port, timeout=30)
+
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": self.api_key,
+            "X-Device-ID": self.device_id,
+        }
+        self._heartbeat_template = self._build_heartbeat_template()
+        self._detection_template = self._build_detection_template()
+
+    def _build_heartbeat_template(self) -> Dict[str, Any]:
+        """Build the heartbeat payload once; test_heartbeat only refreshes the varying leaves."""
+        return {
+            "device_id": self.device_id,
+            "timestamp": 0.0,
+            "status": "online",
+            "stats": {
+                "uptime_seconds": 0,
+                "detection_count": 0,
+                "system": {
+                    "cpu_percent": 0.0,
+                    "memory_percent": 0.0,
+                    "memory_used_mb": 0,
+                    "memory_total_mb": 4096,
+                    "temperature_celsius": 0.0,
+                    "disk_percent": 0.0,
+                    "disk_used_gb": 0.0,
+                    "disk_total_gb": 64,
+                },
+                "power": {
+                    "consumption_watts": 0.0,
+                    "source": "ac",
+                    "battery_percent": None,
+                },
+                "cameras": [
+                    {
+                        "id": "cam-test-1",
+                        "name": "Test Camera",
+                        "model": "Test",
+                        "resolution": "1080p",
+                        "status": "active",
+                    }
+                ],
+                "network": {"latency_ms": 0},
+            },
+            "info": {
+                "name": self._test_device_name,
+                "location": {
+                    "name": "Test Location",
+                    "latitude": 18.52,
+                    "longitude": 73.85,
+                },
+            },
+        }
+
+    def _build_detection_template(self) -> Dict[str, Any]:
+        """Build the detection payload once; test_detection only refreshes the varying fields."""
+        return {
+            "event_id": "",
+            "detection_id": 0,
+            "device_id": self.device_id,
+            "camera_id": "cam-test-1",
+            "timestamp": 0.0,
+            "class_name": "",
+            "confidence": 0.0,
+            "bbox": [100, 100, 400, 400],
+            "location": {
+                "name": "Test Location",
+                "latitude": 18.5204,
+                "longitude": 73.8567,
+            },
+            "metadata": {
+                "priority": "high",
+                "processing_time_ms": 0,
+                "model_version": "yolov8n",
+                "camera_name": "Test Camera",
+            },
+        }
 
     def _load_demo_image(self):
         """Load a demo image for testing."""
@@ -86,8 +413,10 @@ class APITester:
             image_path = demo_dir / image_name
             if image_path.exists():
                 try:
-                    with open(image_path, "rb") as f:
-                        self._demo_image = base64.b64encode(f.read()).decode()
+                    self._demo_image_bytes = _load_base64_cached(image_path)
+                    # The base64 alphabet is JSON-safe, so the quoted bytes can
+                    # be spliced into payloads without another escaping pass.
+                    self._demo_image_json = b'"' + self._demo_image_bytes + b'"'
                     print(
                         f"{Colors.GREEN}✓{Colors.END} Loaded demo image: {image_name}"
                     )
@@ -100,54 +429,75 @@ class APITester:
             f"{Colors.YELLOW}⚠{Colors.END} No demo images found, detection tests will run without images"
         )
 
+    def _with_image(self, payload: bytes) -> bytes:
+        """Splice the pre-encoded demo image, if any, into a serialized payload."""
+        if self._demo_image_json:
+            return _splice(payload, b"image_base64", self._demo_image_json)
+        return payload
+
     def _make_request(
-        self, endpoint: str, method: str = "GET", data: Optional[Dict] = None
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        body: Optional[bytes] = None,
     ) -> Tuple[Optional[Dict], int, float]:
-        """Make an HTTP request and return response, status code, and response time."""
-        url = f"{self.base_url}{endpoint}"
-        payload = json.dumps(data) if data else None
+        """Make an HTTP request and return response, status code, and response time.
 
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Device-ID": self.device_id,
-            "X-Timestamp": str(int(time.time())),
-        }
+        ``body`` may carry an already-serialized JSON payload, in which case
+        ``data`` is ignored.
+        """
+        if body is None and data:
+            body = _dumps(data)
+
+        headers = {**self._base_headers, "X-Timestamp": str(int(time.time()))}
+        if self.compress_requests and body and len(body) > 1024:
+            # Level 1 recovers most of the base64/JSON redundancy at low CPU cost
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
-            req = urllib.request.Request(
-                url,
-                data=payload.encode() if payload else None,
-                headers=headers,
-                method=method,
-            )
+            response = self._send(method, self._base_path + endpoint, body, headers)
+            # Both orjson and json parse bytes directly; no decode pass needed
+            response_data = response.read()
+            response_time_ms = (time.monotonic_ns() - start_ns) / 1_000_000
 
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_time_ms = (time.time() - start_time) * 1000
-                response_data = response.read().decode()
-                return (
-                    json.loads(response_data) if response_data else {},
-                    response.status,
-                    response_time_ms,
-                )
+            if response.status >= 400:
+                try:
+                    error_data = _loads(response_data) if response_data else {}
+                except ValueError:
+                    error_data = {"error": response.reason}
+                return error_data, response.status, response_time_ms
+
+            return (
+                _loads(response_data) if response_data else {},
+                response.status,
+                response_time_ms,
+            )
 
-        except urllib.error.HTTPError as e:
-            response_time_ms = (time.time() - start_time) * 1000
-            try:
-                error_body = e.read().decode()
-                error_data = json.loads(error_body) if error_body else {}
-            except:
-                error_data = {"error": str(e.reason)}
-            return error_data, e.code, response_time_ms
-        except urllib.error.URLError as e:
-            response_time_ms = (time.time() - start_time) * 1000
-            return {"error": str(e.reason)}, 0, response_time_ms
+        except (OSError, http.client.HTTPException) as e:
+            self._conn.close()
+            response_time_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            return {"error": str(e)}, 0, response_time_ms
         except Exception as e:
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             return {"error": str(e)}, 0, response_time_ms
 
+    def _send(
+        self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]
+    ) -> http.client.HTTPResponse:
+        """Send a request on the persistent connection, reconnecting once if it went stale."""
+        try:
+            self._conn.request(method, path, body=body, headers=headers)
+            return self._conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            # The server closed the idle keep-alive socket; retry on a fresh one
+            self._conn.close()
+            self._conn.request(method, path, body=body, headers=headers)
+            return self._conn.getresponse()
+
     def _add_result(
         self,
         name: str,
@@ -158,8 +508,12 @@ class APITester:
         details: Optional[Dict] = None,
     ):
         """Add a test result."""
-        result = TestResult(name, passed, status_code, message, response_time, details)
-        self.results.append(result)
+        self._total_count += 1
+        self._passed_count += passed
+        if self.retain_results:
+            self.results.append(
+                TestResult(name, passed, status_code, message, response_time, details)
+            )
 
         status_icon = (
             f"{Colors.GREEN}✓ PASS{Colors.END}"
@@ -181,7 +535,7 @@ class APITester:
         data = {
             "device_id": self.device_id,
             "info": {
-                "name": f"Test-Device-{self.device_id}",
+                "name": self._test_device_name,
                 "location": {
                     "name": "Test Location",
                     "latitude": 18.5204,
@@ -223,48 +577,20 @@ class APITester:
         """Test POST /api/devices/heartbeat - Device heartbeat."""
         print(f"\n{Colors.CYAN}Testing Heartbeat API...{Colors.END}")
 
-        data = {
-            "device_id": self.device_id,
-            "timestamp": time.time(),
-            "status": "online",
-            "stats": {
-                "uptime_seconds": random.randint(1000, 100000),
-                "detection_count": random.randint(0, 100),
-                "system": {
-                    "cpu_percent": random.uniform(10, 80),
-                    "memory_percent": random.uniform(30, 70),
-                    "memory_used_mb": random.randint(500, 2000),
-                    "memory_total_mb": 4096,
-                    "temperature_celsius": random.uniform(40, 60),
-                    "disk_percent": random.uniform(20, 60),
-                    "disk_used_gb": random.uniform(5, 30),
-                    "disk_total_gb": 64,
-                },
-                "power": {
-                    "consumption_watts": random.uniform(3, 8),
-                    "source": "ac",
-                    "battery_percent": None,
-                },
-                "cameras": [
-                    {
-                        "id": "cam-test-1",
-                        "name": "Test Camera",
-                        "model": "Test",
-                        "resolution": "1080p",
-                        "status": "active",
-                    }
-                ],
-                "network": {"latency_ms": random.randint(20, 100)},
-            },
-            "info": {
-                "name": f"Test-Device-{self.device_id}",
-                "location": {
-                    "name": "Test Location",
-                    "latitude": 18.52,
-                    "longitude": 73.85,
-                },
-            },
-        }
+        data = self._heartbeat_template
+        data["timestamp"] = time.time()
+        stats = data["stats"]
+        stats["uptime_seconds"] = random.randint(1000, 100000)
+        stats["detection_count"] = random.randint(0, 100)
+        system = stats["system"]
+        system["cpu_percent"] = random.uniform(10, 80)
+        system["memory_percent"] = random.uniform(30, 70)
+        system["memory_used_mb"] = random.randint(500, 2000)
+        system["temperature_celsius"] = random.uniform(40, 60)
+        system["disk_percent"] = random.uniform(20, 60)
+        system["disk_used_gb"] = random.uniform(5, 30)
+        stats["power"]["consumption_watts"] = random.uniform(3, 8)
+        stats["network"]["latency_ms"] = random.randint(20, 100)
 
         response, status_code, response_time = self._make_request(
             "/api/devices/heartbeat", "POST", data
@@ -285,36 +611,19 @@ class APITester:
         """Test POST /api/devices/detections - Send detection."""
         print(f"\n{Colors.CYAN}Testing Detection API...{Colors.END}")
 
-        detection_id = int(time.time() * 1000)
+        detection_id = next(self._id_counter)
         species = random.choice(WILD_CAT_SPECIES)
 
-        data = {
-            "event_id": f"evt-{detection_id}",
-            "detection_id": detection_id,
-            "device_id": self.device_id,
-            "camera_id": "cam-test-1",
-            "timestamp": time.time(),
-            "class_name": species,
-            "confidence": random.uniform(0.75, 0.98),
-            "bbox": [100, 100, 400, 400],
-            "location": {
-                "name": "Test Location",
-                "latitude": 18.5204,
-                "longitude": 73.8567,
-            },
-            "metadata": {
-                "priority": "high",
-                "processing_time_ms": random.randint(100, 300),
-                "model_version": "yolov8n",
-                "camera_name": "Test Camera",
-            },
-        }
-
-        if self._demo_image:
-            data["image_base64"] = self._demo_image
+        data = self._detection_template
+        data["event_id"] = f"evt-{detection_id}"
+        data["detection_id"] = detection_id
+        data["timestamp"] = time.time()
+        data["class_name"] = species
+        data["confidence"] = random.uniform(0.75, 0.98)
+        data["metadata"]["processing_time_ms"] = random.randint(100, 300)
 
         response, status_code, response_time = self._make_request(
-            "/api/devices/detections", "POST", data
+            "/api/devices/detections", "POST", body=self._with_image(_dumps(data))
         )
         passed = status_code == 200 and response.get("success", False)
 
@@ -327,7 +636,7 @@ class APITester:
             (
                 response
                 if not passed
-                else {"species": species, "has_image": bool(self._demo_image)}
+                else {"species": species, "has_image": self._demo_image_json is not None}
             ),
         )
         return passed
@@ -374,20 +683,14 @@ class APITester:
 
     def run_all_tests(self) -> bool:
         """Run all API tests."""
-        print(
-            f"\n{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-        )
-        print(
-            f"{Colors.BOLD}{Colors.HEADER}     OPTIC-SHIELD API Test Suite - Full Run{Colors.END}"
-        )
-        print(
-            f"{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-        )
+        sys.stdout.write(_RUN_ALL_BANNER)
         print(f"Dashboard URL: {self.base_url}")
         print(f"Test Device ID: {self.device_id}")
         print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
         self.results = []  # Reset results
+        self._passed_count = 0
+        self._total_count = 0
 
         # Run tests in order
         self.test_device_registration()
@@ -404,45 +707,30 @@ class APITester:
 
     def print_report(self) -> bool:
         """Print a detailed test report."""
-        passed = sum(1 for r in self.results if r.passed)
-        total = len(self.results)
+        passed = self._passed_count
+        total = self._total_count
         all_passed = passed == total
 
-        print(
-            f"\n{Colors.BOLD}═══════════════════════════════════════════════════════{Colors.END}"
-        )
-        print(f"{Colors.BOLD}                    TEST REPORT{Colors.END}")
-        print(
-            f"{Colors.BOLD}═══════════════════════════════════════════════════════{Colors.END}"
-        )
+        sys.stdout.write(_REPORT_HEADER)
         print(f"Dashboard URL: {self.base_url}")
         print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"\n{'Test':<30} {'Status':<10} {'Code':<8} {'Time':<10}")
-        print("─" * 60)
+        sys.stdout.write(_REPORT_COLUMNS)
 
         for r in self.results:
-            status = (
-                f"{Colors.GREEN}PASS{Colors.END}"
-                if r.passed
-                else f"{Colors.RED}FAIL{Colors.END}"
-            )
-            print(
-                f"{r.name:<30} {status:<18} {r.status_code:<8} {r.response_time_ms:.0f}ms"
+            sys.stdout.write(
+                _ROW_FMT(
+                    name=r.name,
+                    status=_STATUS_PASS if r.passed else _STATUS_FAIL,
+                    code=r.status_code,
+                    rt=r.response_time_ms,
+                )
             )
 
-        print("─" * 60)
-
-        if all_passed:
-            print(
-                f"\n{Colors.GREEN}{Colors.BOLD}✓ Summary: {passed}/{total} tests passed{Colors.END}"
+        sys.stdout.write(_REPORT_RULE)
+        sys.stdout.write(
+            (_SUMMARY_PASS if all_passed else _SUMMARY_FAIL).format_map(
+                {"passed": passed, "total": total}
             )
-        else:
-            print(
-                f"\n{Colors.RED}{Colors.BOLD}✗ Summary: {passed}/{total} tests passed{Colors.END}"
-            )
-
-        print(
-            f"{Colors.BOLD}═══════════════════════════════════════════════════════{Colors.END}\n"
         )
 
         return all_passed
@@ -456,15 +744,7 @@ class APITester:
         detection_rate: float = 0.3,
     ):
         """Emulate a device continuously to a production portal."""
-        print(
-            f"\n{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-        )
-        print(
-            f"{Colors.BOLD}{Colors.HEADER}     OPTIC-SHIELD Device Emulation{Colors.END}"
-        )
-        print(
-            f"{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-        )
+        sys.stdout.write(_EMULATION_BANNER)
         print(f"Dashboard URL: {self.base_url}")
         print(f"Device ID: {self.device_id}")
         print(f"Device Name: {device_name}")
@@ -472,9 +752,66 @@ class APITester:
         print(f"Animal Category: {animal_category}")
         print(f"Heartbeat Interval: {interval}s")
         print(f"Detection Rate: {detection_rate}")
-        print(f"\nPress Ctrl+C to stop emulation.\n")
+        print("\nPress Ctrl+C to stop emulation.\n")
+
+        state = self._start_emulation(
+            device_name, location_name, animal_category, interval, detection_rate
+        )
+        if state is None:
+            return
+
+        try:
+            while True:
+                self._emulate_heartbeat(state)
+                if state.should_detect():
+                    self._emulate_detection(state)
+                time.sleep(interval)
+
+        except KeyboardInterrupt:
+            _emulation_log.flush()
+            print(f"\n\n{Colors.CYAN}Emulation stopped.{Colors.END}")
+            print(f"Total heartbeats: {state.heartbeat_count}")
+            print(f"Total detections: {state.detection_count}")
 
-        # Register device first
+    async def emulate_device_async(
+        self,
+        device_name: str,
+        location_name: str,
+        animal_category: str,
+        interval: int = 10,
+        detection_rate: float = 0.3,
+    ):
+        """Emulate a device from an asyncio task so many devices can share one process.
+
+        Requests still go over this tester's blocking keep-alive connection,
+        so they run in worker threads while other devices' tasks proceed.
+        """
+        state = await asyncio.to_thread(
+            self._start_emulation,
+            device_name,
+            location_name,
+            animal_category,
+            interval,
+            detection_rate,
+        )
+        if state is None:
+            return
+
+        while True:
+            await asyncio.to_thread(self._emulate_heartbeat, state)
+            if state.should_detect():
+                await asyncio.to_thread(self._emulate_detection, state)
+            await asyncio.sleep(interval)
+
+    def _start_emulation(
+        self,
+        device_name: str,
+        location_name: str,
+        animal_category: str,
+        interval: int,
+        detection_rate: float,
+    ) -> Optional["_EmulationState"]:
+        """Register the emulated device and return its per-tick state."""
         reg_data = {
             "device_id": self.device_id,
             "info": {
@@ -491,7 +828,7 @@ class APITester:
                 "tags": ["wildlife", animal_category],
                 "cameras": [
                     {
-                        "id": f"cam-{self.device_id}",
+                        "id": self._cam_id,
                         "name": "Camera 1",
                         "model": "Pi Camera 3",
                         "resolution": "1920x1080",
@@ -503,10 +840,14 @@ class APITester:
 
         response, status, _ = self._make_request("/api/devices", "POST", reg_data)
         if status == 200:
-            print(f"{Colors.GREEN}✓ Device registered successfully{Colors.END}")
+            print(
+                f"{Colors.GREEN}✓ Device {self.device_id} registered successfully{Colors.END}"
+            )
         else:
-            print(f"{Colors.RED}✗ Failed to register device: {response}{Colors.END}")
-            return
+            print(
+                f"{Colors.RED}✗ Failed to register device {self.device_id}: {response}{Colors.END}"
+            )
+            return None
 
         # Select species based on category
         if animal_category == "leopard":
@@ -514,135 +855,252 @@ class APITester:
         else:
             species_list = WILD_CAT_SPECIES
 
-        detection_count = 0
-        heartbeat_count = 0
+        self._emulation = _EmulationState(
+            self.device_id,
+            self._cam_id,
+            self._id_counter,
+            location_name,
+            species_list,
+            interval,
+            detection_rate,
+        )
+        return self._emulation
 
-        try:
-            while True:
-                # Send heartbeat
-                heartbeat_data = {
-                    "device_id": self.device_id,
-                    "timestamp": time.time(),
-                    "status": "online",
-                    "stats": {
-                        "uptime_seconds": (heartbeat_count + 1) * interval,
-                        "detection_count": detection_count,
-                        "system": {
-                            "cpu_percent": random.uniform(15, 45),
-                            "memory_percent": random.uniform(40, 60),
-                            "memory_used_mb": random.randint(1500, 2500),
-                            "memory_total_mb": 4096,
-                            "temperature_celsius": random.uniform(42, 55),
-                            "disk_percent": random.uniform(20, 40),
-                            "disk_used_gb": random.uniform(8, 20),
-                            "disk_total_gb": 64,
-                        },
-                        "power": {
-                            "consumption_watts": random.uniform(4, 7),
-                            "source": "ac",
-                            "battery_percent": None,
-                        },
-                        "cameras": [
-                            {
-                                "id": f"cam-{self.device_id}",
-                                "name": "Camera 1",
-                                "model": "Pi Camera 3",
-                                "resolution": "1080p",
-                                "status": "active",
-                            }
-                        ],
-                        "network": {"latency_ms": random.randint(30, 100)},
-                    },
-                }
+    def _emulate_heartbeat(self, state: "_EmulationState"):
+        """Send one emulated heartbeat."""
+        response, status, resp_time = self._make_request(
+            "/api/devices/heartbeat", "POST", body=state.heartbeat()
+        )
+        state.heartbeat_count += 1
+        _emulation_log.write(
+            "[%s] [%s] %s Heartbeat #%d (%.0fms)\n"
+            % (
+                time.strftime("%H:%M:%S"),
+                self.device_id,
+                _ICON_OK if status == 200 else _ICON_FAIL,
+                state.heartbeat_count,
+                resp_time,
+            )
+        )
 
-                response, status, resp_time = self._make_request(
-                    "/api/devices/heartbeat", "POST", heartbeat_data
-                )
-                heartbeat_count += 1
-                status_icon = (
-                    f"{Colors.GREEN}✓{Colors.END}"
-                    if status == 200
-                    else f"{Colors.RED}✗{Colors.END}"
-                )
-                print(
-                    f"[{datetime.now().strftime('%H:%M:%S')}] {status_icon} Heartbeat #{heartbeat_count} ({resp_time:.0f}ms)"
-                )
+    def _emulate_detection(self, state: "_EmulationState"):
+        """Send one emulated detection."""
+        species, payload = state.detection()
+        response, status, resp_time = self._make_request(
+            "/api/devices/detections",
+            "POST",
+            body=self._with_image(payload),
+        )
+        state.detection_count += 1
+        _emulation_log.write(
+            "[%s] [%s] %s Detection: %s sent (%.0fms)\n"
+            % (
+                time.strftime("%H:%M:%S"),
+                self.device_id,
+                _ICON_OK if status == 200 else _ICON_FAIL,
+                _SPECIES_FMT % species,
+                resp_time,
+            )
+        )
 
-                # Possibly send detection
-                if random.random() < detection_rate:
-                    species = random.choice(species_list)
-                    det_data = {
-                        "event_id": f"evt-{int(time.time() * 1000)}",
-                        "detection_id": int(time.time() * 1000),
-                        "device_id": self.device_id,
-                        "camera_id": f"cam-{self.device_id}",
-                        "timestamp": time.time(),
-                        "class_name": species,
-                        "confidence": random.uniform(0.75, 0.96),
-                        "bbox": [
-                            random.randint(50, 150),
-                            random.randint(50, 150),
-                            random.randint(350, 550),
-                            random.randint(350, 550),
-                        ],
-                        "location": {
-                            "name": location_name,
-                            "latitude": 18.52,
-                            "longitude": 73.85,
-                        },
-                        "metadata": {
-                            "priority": "high",
-                            "processing_time_ms": random.randint(80, 250),
-                            "model_version": "yolov8n",
-                        },
-                    }
-                    if self._demo_image:
-                        det_data["image_base64"] = self._demo_image
 
-                    response, status, resp_time = self._make_request(
-                        "/api/devices/detections", "POST", det_data
-                    )
-                    detection_count += 1
-                    status_icon = (
-                        f"{Colors.GREEN}✓{Colors.END}"
-                        if status == 200
-                        else f"{Colors.RED}✗{Colors.END}"
-                    )
-                    print(
-                        f"[{datetime.now().strftime('%H:%M:%S')}] {status_icon} Detection: {Colors.YELLOW}{species}{Colors.END} sent ({resp_time:.0f}ms)"
-                    )
+class _EmulationState:
+    """Per-device telemetry generator and counters for emulation mode."""
 
-                time.sleep(interval)
+    def __init__(
+        self,
+        device_id: str,
+        camera_id: str,
+        id_counter: Iterator[int],
+        location_name: str,
+        species_list: List[str],
+        interval: int,
+        detection_rate: float,
+    ):
+        self.device_id = device_id
+        self.camera_id = camera_id
+        self._id_counter = id_counter
+        self.location_name = location_name
+        self.interval = interval
+        self.detection_rate = detection_rate
+        self.heartbeat_count = 0
+        self.detection_count = 0
+
+        # Telemetry values are drawn in batches rather than once per field per tick
+        self.cpu_pool = _RandomPool(15, 45)
+        self.mem_pool = _RandomPool(40, 60)
+        self.mem_used_pool = _RandomPool(1500, 2500, integer=True)
+        self.temp_pool = _RandomPool(42, 55)
+        self.disk_pool = _RandomPool(20, 40)
+        self.disk_used_pool = _RandomPool(8, 20)
+        self.watts_pool = _RandomPool(4, 7)
+        self.latency_pool = _RandomPool(30, 100, integer=True)
+        self.confidence_pool = _RandomPool(0.75, 0.96)
+        self.bbox_min_pool = _RandomPool(50, 150, integer=True)
+        self.bbox_max_pool = _RandomPool(350, 550, integer=True)
+        self.processing_pool = _RandomPool(80, 250, integer=True)
+        self.coin_pool = _RandomPool(0.0, 1.0, size=1024)
+        self.species_pool = _ChoicePool(species_list)
+
+        # Substructures that never change are serialized once and spliced in
+        self._cameras_json = _dumps(
+            [
+                {
+                    "id": self.camera_id,
+                    "name": "Camera 1",
+                    "model": "Pi Camera 3",
+                    "resolution": "1080p",
+                    "status": "active",
+                }
+            ]
+        )
+        self._location_json = _dumps(
+            {"name": location_name, "latitude": 18.52, "longitude": 73.85}
+        )
 
-        except KeyboardInterrupt:
-            print(f"\n\n{Colors.CYAN}Emulation stopped.{Colors.END}")
-            print(f"Total heartbeats: {heartbeat_count}")
-            print(f"Total detections: {detection_count}")
+        # The heartbeat tree is allocated once; each tick rewrites its leaves
+        self._hb_system = {
+            "cpu_percent": 0.0,
+            "memory_percent": 0.0,
+            "memory_used_mb": 0,
+            "memory_total_mb": 4096,
+            "temperature_celsius": 0.0,
+            "disk_percent": 0.0,
+            "disk_used_gb": 0.0,
+            "disk_total_gb": 64,
+        }
+        self._hb_power = {
+            "consumption_watts": 0.0,
+            "source": "ac",
+            "battery_percent": None,
+        }
+        self._hb_network = {"latency_ms": 0}
+        self._hb_stats = {
+            "uptime_seconds": 0,
+            "detection_count": 0,
+            "system": self._hb_system,
+            "power": self._hb_power,
+            "network": self._hb_network,
+        }
+        self._hb = {"device_id": device_id, "timestamp": 0.0, "status": "online"}
+
+    def should_detect(self) -> bool:
+        return self.coin_pool.next() < self.detection_rate
+
+    def heartbeat(self) -> bytes:
+        """Serialize the next heartbeat payload."""
+        stats = self._hb_stats
+        stats["uptime_seconds"] = (self.heartbeat_count + 1) * self.interval
+        stats["detection_count"] = self.detection_count
+        system = self._hb_system
+        system["cpu_percent"] = self.cpu_pool.next()
+        system["memory_percent"] = self.mem_pool.next()
+        system["memory_used_mb"] = self.mem_used_pool.next()
+        system["temperature_celsius"] = self.temp_pool.next()
+        system["disk_percent"] = self.disk_pool.next()
+        system["disk_used_gb"] = self.disk_used_pool.next()
+        self._hb_power["consumption_watts"] = self.watts_pool.next()
+        self._hb_network["latency_ms"] = self.latency_pool.next()
+        self._hb["timestamp"] = time.time()
+
+        return _splice(
+            _dumps(self._hb),
+            b"stats",
+            _splice(_dumps(stats), b"cameras", self._cameras_json),
+        )
+
+    def detection(self) -> Tuple[str, bytes]:
+        """Pick a species and serialize the next detection payload (without the image)."""
+        species = self.species_pool.next()
+        detection_id = next(self._id_counter)
+        payload = _dumps(
+            {
+                "event_id": f"evt-{detection_id}",
+                "detection_id": detection_id,
+                "device_id": self.device_id,
+                "camera_id": self.camera_id,
+                "timestamp": time.time(),
+                "class_name": species,
+                "confidence": self.confidence_pool.next(),
+                "bbox": [
+                    self.bbox_min_pool.next(),
+                    self.bbox_min_pool.next(),
+                    self.bbox_max_pool.next(),
+                    self.bbox_max_pool.next(),
+                ],
+                "metadata": {
+                    "priority": "high",
+                    "processing_time_ms": self.processing_pool.next(),
+                    "model_version": "yolov8n",
+                },
+            }
+        )
+        return species, _splice(payload, b"location", self._location_json)
+
+
+def emulate_fleet(
+    tester: APITester,
+    num_devices: int,
+    device_name: str,
+    location_name: str,
+    animal_category: str,
+    interval: int = 10,
+    detection_rate: float = 0.3,
+):
+    """Emulate several devices concurrently from a single event loop.
+
+    ``tester`` is the first device; the others reuse its base URL, API key
+    and already-encoded demo image, with numbered device IDs.
+    """
+    testers = [tester] + [
+        APITester(
+            tester.base_url,
+            tester.api_key,
+            f"{tester.device_id}-{i + 1}",
+            demo_image=tester._demo_image_bytes,
+            compress_requests=tester.compress_requests,
+        )
+        for i in range(1, num_devices)
+    ]
+
+    sys.stdout.write(_FLEET_BANNER)
+    print(f"Dashboard URL: {tester.base_url}")
+    print(f"Devices: {num_devices}")
+    print(f"Location: {location_name}")
+    print(f"Animal Category: {animal_category}")
+    print(f"Heartbeat Interval: {interval}s")
+    print(f"Detection Rate: {detection_rate}")
+    print("\nPress Ctrl+C to stop emulation.\n")
+
+    async def run_all():
+        await asyncio.gather(
+            *(
+                tester.emulate_device_async(
+                    f"{device_name}-{i + 1}",
+                    location_name,
+                    animal_category,
+                    interval,
+                    detection_rate,
+                )
+                for i, tester in enumerate(testers)
+            )
+        )
+
+    try:
+        asyncio.run(run_all())
+    except KeyboardInterrupt:
+        pass
+    _emulation_log.flush()
+
+    states = [t._emulation for t in testers if t._emulation is not None]
+    print(f"\n\n{Colors.CYAN}Emulation stopped.{Colors.END}")
+    print(f"Total heartbeats: {sum(s.heartbeat_count for s in states)}")
+    print(f"Total detections: {sum(s.detection_count for s in states)}")
 
 
 def print_menu():
     """Print the interactive menu."""
-    print(
-        f"\n{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-    )
-    print(
-        f"{Colors.BOLD}{Colors.HEADER}     OPTIC-SHIELD API Testing Suite{Colors.END}"
-    )
-    print(
-        f"{Colors.BOLD}{Colors.HEADER}═══════════════════════════════════════════════════════{Colors.END}"
-    )
-    print(f"\n{Colors.BOLD}Select an option:{Colors.END}")
-    print(f"  {Colors.CYAN}1.{Colors.END} Test Device Registration API")
-    print(f"  {Colors.CYAN}2.{Colors.END} Test Heartbeat API")
-    print(f"  {Colors.CYAN}3.{Colors.END} Test Detection API")
-    print(f"  {Colors.CYAN}4.{Colors.END} Test Device List API (GET)")
-    print(f"  {Colors.CYAN}5.{Colors.END} Test Detection Logs API (GET)")
-    print(f"  {Colors.GREEN}6.{Colors.END} Run ALL Tests")
-    print(f"  {Colors.YELLOW}7.{Colors.END} Emulate Device to Production Portal")
-    print(f"  {Colors.RED}0.{Colors.END} Exit")
-    print(
-        f"\n{Colors.BOLD}═══════════════════════════════════════════════════════{Colors.END}"
-    )
+    sys.stdout.write(_MENU)
 
 
 def main():
@@ -654,6 +1112,7 @@ Examples:
   python api_test.py --url https://your-dashboard.vercel.app --api-key your-api-key
   python api_test.py --url http://localhost:3000 --api-key development-key --run-all
   python api_test.py --url https://optic-shield.vercel.app --api-key prod-key --emulate
+  python api_test.py --url https://optic-shield.vercel.app --api-key prod-key --emulate --devices 20
         """,
     )
     parser.add_argument(
@@ -680,6 +1139,22 @@ Examples:
     parser.add_argument(
         "--emulate", action="store_true", help="Start device emulation mode"
     )
+    parser.add_argument(
+        "--no-retain-results",
+        action="store_true",
+        help="Only keep pass/fail counts, not per-test rows, for long sessions",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Gzip-compress request bodies over 1KB (server must accept gzip)",
+    )
+    parser.add_argument(
+        "--devices",
+        type=int,
+        default=1,
+        help="Number of devices to emulate concurrently in emulation mode",
+    )
 
     args = parser.parse_args()
 
@@ -690,7 +1165,13 @@ Examples:
         else f"{Colors.BOLD}API Key:{Colors.END} {args.api_key}"
     )
 
-    tester = APITester(args.url, args.api_key, args.device_id)
+    tester = APITester(
+        args.url,
+        args.api_key,
+        args.device_id,
+        retain_results=not args.no_retain_results,
+        compress_requests=args.gzip,
+    )
 
     # Run all tests if --run-all flag is set
     if args.run_all:
@@ -712,7 +1193,16 @@ Examples:
             )
             or "leopard"
         )
-        tester.emulate_device(device_name, location_name, category)
+        if args.devices > 1:
+            emulate_fleet(
+                tester,
+                args.devices,
+                device_name,
+                location_name,
+                category,
+            )
+        else:
+            tester.emulate_device(device_name, location_name, category)
         return
 
     # Interactive menu loop
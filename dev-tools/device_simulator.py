@@ -11,108 +11,175 @@ import time
 import json
 import random
 import argparse
+import asyncio
 import threading
-import urllib.request
-import urllib.error
+import http.client
+import urllib.parse
 import base64
 import hashlib
 import hmac
+import mimetypes
+import mmap
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+
+    # orjson emits compact bytes directly, skipping the str -> bytes encode,
+    # and parses response bytes without a separate decode
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+try:
+    import numpy as np
+
+    _np_rng = np.random.default_rng()
+except ImportError:
+    _np_rng = None
+
+try:
+    from numba import njit
+except ImportError:
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the numeric helpers run as plain Python."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+def _log(message: str):
+    """Print a line in one write so concurrent device workers never interleave."""
+    sys.stdout.write(message + "\n")
+
+
+@njit(cache=True, fastmath=True)
+def _mix_metrics(cpu_base, mem_base, temp_base, noise_cpu, noise_mem, noise_temp):
+    """Apply noise to a device's base readings and clamp to realistic ranges."""
+    return (
+        max(5.0, min(95.0, cpu_base + noise_cpu)),
+        max(20.0, min(90.0, mem_base + noise_mem)),
+        max(35.0, min(85.0, temp_base + noise_temp)),
+    )
+
+
+# Values repeated in every payload, interned so each is one shared object
+STATUS_ONLINE = sys.intern("online")
+CAMERA_ACTIVE = sys.intern("active")
+ENVIRONMENT = sys.intern("production")
+FIRMWARE_VERSION = sys.intern("1.0.0")
+MODEL_VERSION = sys.intern("yolov8n")
+PRIORITY_HIGH = sys.intern("high")
+PRIORITY_NORMAL = sys.intern("normal")
+TAG_WILDLIFE = sys.intern("wildlife")
+TAG_SIMULATION = sys.intern("simulation")
+LOCATION_TIMEZONE = sys.intern("Asia/Kolkata")
+
 # Wildlife locations for simulation - Maharashtra Pune villages
 WILDLIFE_LOCATIONS = [
     {
         "name": "Lonavala Forest Reserve",
         "latitude": 18.7540,
         "longitude": 73.4057,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Khandala Wildlife Zone",
         "latitude": 18.7512,
         "longitude": 73.3765,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Mulshi Lake Area",
         "latitude": 18.6417,
         "longitude": 73.5178,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Pawna Dam Region",
         "latitude": 18.6989,
         "longitude": 73.5113,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Tikona Fort Forest",
         "latitude": 18.6320,
         "longitude": 73.5340,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Lavasa Hills",
         "latitude": 18.4135,
         "longitude": 73.5174,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Rajgad Fort Area",
         "latitude": 18.2475,
         "longitude": 73.6525,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Torna Fort Region",
         "latitude": 18.2806,
         "longitude": 73.7197,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Sinhagad Wildlife",
         "latitude": 18.3589,
         "longitude": 73.7547,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Panshet Dam Forest",
         "latitude": 18.4167,
         "longitude": 73.4167,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Varasgaon Wildlife",
         "latitude": 18.4333,
         "longitude": 73.7333,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Bhimashankar Reserve",
         "latitude": 19.0778,
         "longitude": 73.5325,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Matheran Eco Zone",
         "latitude": 18.9833,
         "longitude": 73.2667,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Karnala Bird Sanctuary",
         "latitude": 18.8750,
         "longitude": 73.1167,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
     {
         "name": "Sanjay Gandhi National Park",
         "latitude": 19.2147,
         "longitude": 72.9315,
-        "timezone": "Asia/Kolkata",
+        "timezone": LOCATION_TIMEZONE,
     },
 ]
 
@@ -218,6 +285,9 @@ DEMO_IMAGES = ["jaguar.jpg", "lion.png"]
 # Animal categories available
 ANIMAL_CATEGORIES = list(WILDLIFE_CLASSES.keys())
 
+# Sender ID used for requests that carry several devices at once
+BATCH_DEVICE_ID = "device-simulator"
+
 
 @dataclass
 class SimulatedDevice:
@@ -239,6 +309,15 @@ class SimulatedDevice:
     power_source: str = "ac"
     detection_count: int = 0
 
+    # Registration fields that never change, built once in _create_device
+    envelope: Dict[str, Any] = field(default_factory=dict)
+    # Heartbeat stats tree, updated in place by _simulate_metrics
+    stats: Dict[str, Any] = field(default_factory=dict)
+    # Constant detection fields for each camera, parallel to ``cameras``
+    detection_skeletons: List[Dict[str, Any]] = field(default_factory=list)
+    # Private generator, so devices never share random module state
+    rng: random.Random = field(default_factory=random.Random)
+
 
 class DeviceSimulator:
     """Simulates multiple devices sending telemetry to the dashboard."""
@@ -253,15 +332,26 @@ class DeviceSimulator:
         detection_probability: float = 0.1,
         send_images: bool = True,
         animal_category: str = "leopard",
+        batch_heartbeats: bool = False,
+        multipart_images: bool = False,
     ):
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
         self.device_secret = device_secret
+        # Keyed HMAC state is built once; signing copies it instead of
+        # re-deriving the inner/outer key pads on every request
+        self._hmac_template = (
+            hmac.new(device_secret.encode(), None, hashlib.sha256)
+            if device_secret
+            else None
+        )
         self.num_devices = num_devices
         self.heartbeat_interval = heartbeat_interval
         self.detection_probability = detection_probability
         self.send_images = send_images
         self.animal_category = animal_category
+        self.batch_heartbeats = batch_heartbeats
+        self.multipart_images = multipart_images
 
         # Get wildlife classes for the selected category
         self.wildlife_classes = WILDLIFE_CLASSES.get(
@@ -269,14 +359,29 @@ class DeviceSimulator:
         )
 
         self.devices: List[SimulatedDevice] = []
-        self._stop_event = threading.Event()
-        self._threads: List[threading.Thread] = []
-        self._demo_images: Dict[str, str] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._demo_images: Dict[str, bytes] = {}
+        self._demo_images_b64: Dict[str, str] = {}
+        self._class_images: Dict[str, List[str]] = {}
+        self._multipart_boundary = uuid.uuid4().hex
+        self._base_headers: Dict[str, Dict[str, str]] = {}
+
+        # Each device thread keeps one keep-alive connection to the dashboard,
+        # so heartbeats and detections skip the per-request TCP/TLS handshake
+        parts = urllib.parse.urlsplit(self.api_url)
+        self._base_path = parts.path
+        self._conn_host = parts.hostname
+        self._conn_port = parts.port
+        self._conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._local = threading.local()
 
     def _generate_device_id(self) -> str:
         """Generate a unique device ID."""
-        import uuid
-
         return str(uuid.uuid4())[:8]
 
     def _create_cameras(self, device_id: str, count: int = 1) -> List[Dict[str, Any]]:
@@ -289,7 +394,7 @@ class DeviceSimulator:
                     "name": f"Camera {i + 1}",
                     "model": random.choice(CAMERA_MODELS),
                     "resolution": random.choice(["640x480", "1280x720", "1920x1080"]),
-                    "status": "active",
+                    "status": CAMERA_ACTIVE,
                 }
             )
         return cameras
@@ -299,13 +404,13 @@ class DeviceSimulator:
         device_id = self._generate_device_id()
         location = WILDLIFE_LOCATIONS[index % len(WILDLIFE_LOCATIONS)]
 
-        return SimulatedDevice(
+        device = SimulatedDevice(
             device_id=device_id,
             name=f"OPTIC-{device_id.upper()}",
             location=location,
             hardware_model=random.choice(HARDWARE_MODELS),
             cameras=self._create_cameras(device_id, random.randint(1, 3)),
-            start_time=time.time(),
+            start_time=time.monotonic(),
             cpu_base=random.uniform(15, 35),
             memory_base=random.uniform(30, 50),
             temperature_base=random.uniform(40, 55),
@@ -313,40 +418,109 @@ class DeviceSimulator:
             storage_total=random.choice([32, 64, 128, 256]),
             power_source=random.choice(["ac", "solar", "battery"]),
         )
+        device.envelope = {
+            "device_id": device_id,
+            "name": device.name,
+            "location": location,
+            "environment": ENVIRONMENT,
+            "version": FIRMWARE_VERSION,
+            "hardware_model": device.hardware_model,
+            "tags": [
+                TAG_WILDLIFE,
+                TAG_SIMULATION,
+                sys.intern(location["name"].split()[0].lower()),
+            ],
+            "cameras": device.cameras,
+        }
+        detection_location = {
+            "latitude": location["latitude"],
+            "longitude": location["longitude"],
+            "name": location["name"],
+        }
+        device.detection_skeletons = [
+            {
+                "device_id": device_id,
+                "camera_id": camera["id"],
+                "location": detection_location,
+                "metadata": {
+                    "model_version": MODEL_VERSION,
+                    "camera_name": camera["name"],
+                    "animal_category": self.animal_category,
+                },
+            }
+            for camera in device.cameras
+        ]
+        device.stats = {
+            "uptime_seconds": 0.0,
+            "detection_count": 0,
+            "system": {
+                "cpu_percent": 0.0,
+                "memory_percent": 0.0,
+                "memory_used_mb": 0.0,
+                "memory_total_mb": random.choice([2048, 4096, 8192]),
+                "temperature_celsius": 0.0,
+                "disk_percent": 0.0,
+                "disk_used_gb": 0.0,
+                "disk_total_gb": device.storage_total,
+            },
+            "power": {
+                "consumption_watts": 0.0,
+                "source": device.power_source,
+                "battery_percent": None,
+            },
+            "cameras": device.cameras,
+            "network": {
+                "latency_ms": 0,
+            },
+        }
+        return device
 
     def _load_demo_images(self):
         """Load demo images for detection simulation."""
         demo_dir = Path(__file__).parent.parent / "demo-img"
 
         for image_name in DEMO_IMAGES:
-            image_path = demo_dir / image_name
-            if image_path.exists():
-                try:
-                    with open(image_path, "rb") as f:
-                        image_data = f.read()
-                        # Compress image if needed (simple resize simulation)
-                        if len(image_data) > 500 * 1024:  # If > 500KB
-                            # For simulation, we'll just note it would be compressed
-                            pass
-                        self._demo_images[image_name] = base64.b64encode(
-                            image_data
-                        ).decode()
-                        print(
-                            f"Loaded demo image: {image_name} ({len(image_data)} bytes)"
-                        )
-                except Exception as e:
-                    print(f"Failed to load {image_name}: {e}")
-
-    def _generate_signature(self, payload: str, timestamp: int, device_id: str) -> str:
+            try:
+                # Opening directly doubles as the existence check, and the
+                # mapping lets base64 read the file without an extra copy
+                with open(demo_dir / image_name, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mm:
+                    size = len(mm)
+                    if self.multipart_images:
+                        # Multipart uploads send the raw bytes
+                        self._demo_images[image_name] = mm[:]
+                    else:
+                        self._demo_images_b64[image_name] = base64.b64encode(
+                            mm
+                        ).decode("ascii")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"Failed to load {image_name}: {e}")
+                continue
+            print(f"Loaded demo image: {image_name} ({size} bytes)")
+
+        # Resolve each wildlife class to its loaded images once, falling back to
+        # every loaded image, so detections just pick from a ready-made list
+        loaded = self._demo_images if self.multipart_images else self._demo_images_b64
+        self._class_images = {
+            w["name"]: [img for img in w.get("images", []) if img in loaded]
+            or list(loaded)
+            for w in self.wildlife_classes
+        }
+
+    def _generate_signature(self, payload: bytes, timestamp: int, device_id: str) -> str:
         """Generate HMAC signature for secure requests."""
         if not self.device_secret:
             return ""
 
-        message = f"{device_id}:{timestamp}:{payload}"
-        signature = hmac.new(
-            self.device_secret.encode(), message.encode(), hashlib.sha256
-        ).hexdigest()
-        return signature
+        # Feed the pieces separately so the (possibly image-sized) payload is
+        # never copied into a concatenated message
+        h = self._hmac_template.copy()
+        h.update(f"{device_id}:{timestamp}:".encode())
+        h.update(payload)
+        return h.hexdigest()
 
     def _make_request(
         self,
@@ -354,126 +528,204 @@ class DeviceSimulator:
         method: str = "POST",
         data: Optional[Dict] = None,
         device_id: str = "",
+        body: Optional[bytes] = None,
+        content_type: str = "application/json",
+        timestamp: Optional[int] = None,
     ) -> Optional[Dict]:
-        """Make an HTTP request to the dashboard API."""
-        url = f"{self.api_url}{endpoint}"
-
-        payload = json.dumps(data) if data else ""
-        timestamp = int(time.time())
-
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Device-ID": device_id,
-            "X-Timestamp": str(timestamp),
-        }
+        """Make an HTTP request to the dashboard API.
+
+        ``body`` sends pre-encoded bytes (e.g. multipart) instead of ``data``;
+        ``timestamp`` reuses the caller's clock reading for the auth header.
+        """
+        if body is not None:
+            payload = body
+        else:
+            payload = _dumps(data) if data else b""
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000_000
+
+        # Only the timestamp and signature vary between calls from a sender
+        base_headers = self._base_headers.get(device_id)
+        if base_headers is None:
+            base_headers = self._base_headers[device_id] = {
+                "Content-Type": "application/json",
+                "X-API-Key": self.api_key,
+                "X-Device-ID": device_id,
+            }
+        headers = {**base_headers, "X-Timestamp": str(timestamp)}
+        if content_type != "application/json":
+            headers["Content-Type"] = content_type
 
         # Add signature if device secret is provided
         signature = self._generate_signature(payload, timestamp, device_id)
         if signature:
             headers["X-Signature"] = signature
 
+        conn = self._get_connection()
+        path = self._base_path + endpoint
         try:
-            req = urllib.request.Request(
-                url,
-                data=payload.encode() if payload else None,
-                headers=headers,
-                method=method,
-            )
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                response_data = response.read().decode()
-                return json.loads(response_data) if response_data else {}
-
-        except urllib.error.HTTPError as e:
-            print(f"[{device_id}] HTTP error {e.code}: {e.reason}")
-            return None
-        except urllib.error.URLError as e:
-            print(f"[{device_id}] Network error: {e.reason}")
+            try:
+                conn.request(method, path, body=payload or None, headers=headers)
+                response = conn.getresponse()
+            except (
+                http.client.RemoteDisconnected,
+                ConnectionResetError,
+                BrokenPipeError,
+            ):
+                # The server dropped the idle keep-alive socket; retry once
+                conn.close()
+                conn.request(method, path, body=payload or None, headers=headers)
+                response = conn.getresponse()
+
+            response_data = response.read()
+            if response.status >= 400:
+                _log(f"[{device_id}] HTTP error {response.status}: {response.reason}")
+                return None
+            if not response_data:
+                return {}
+            return _loads(response_data)
+
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            _log(f"[{device_id}] Network error: {e}")
             return None
         except Exception as e:
-            print(f"[{device_id}] Request error: {e}")
+            _log(f"[{device_id}] Request error: {e}")
             return None
 
-    def _simulate_metrics(self, device: SimulatedDevice) -> Dict[str, Any]:
-        """Generate simulated telemetry metrics."""
-        # Add some variation to base values
-        cpu = device.cpu_base + random.uniform(-10, 30)
-        cpu = max(5, min(95, cpu))
+    def _encode_multipart(self, metadata: Dict[str, Any], image_name: str) -> bytes:
+        """Encode detection metadata plus the raw image as multipart/form-data."""
+        boundary = self._multipart_boundary.encode()
+        return b"".join(
+            (
+                b"--" + boundary + b"\r\n",
+                b'Content-Disposition: form-data; name="metadata"; '
+                b'filename="metadata.json"\r\n',
+                b"Content-Type: application/json\r\n\r\n",
+                _dumps(metadata),
+                b"\r\n--" + boundary + b"\r\n",
+                b'Content-Disposition: form-data; name="image"; filename="'
+                + image_name.encode()
+                + b'"\r\n',
+                b"Content-Type: "
+                + (mimetypes.guess_type(image_name)[0] or "image/jpeg").encode()
+                + b"\r\n\r\n",
+                self._demo_images[image_name],
+                b"\r\n--" + boundary + b"--\r\n",
+            )
+        )
+
+    def _get_connection(self) -> http.client.HTTPConnection:
+        """Return the calling thread's persistent connection to the dashboard."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._conn_cls(self._conn_host, self._conn_port, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _draw_device_noise(self, rng: Any) -> tuple:
+        """Draw one device's metric noise from its own ``random.Random``.
+
+        Returns ``(cpu, memory, temperature, storage, latency_ms, detected)``.
+        Per-device draws never touch the shared numpy generator, so worker
+        threads each stay on their device's ``rng``.
+        """
+        return (
+            rng.uniform(-10, 30),
+            rng.uniform(-5, 15),
+            rng.uniform(-5, 15),
+            rng.uniform(0, 0.1),
+            rng.randint(20, 200),
+            rng.random() < self.detection_probability,
+        )
 
-        memory = device.memory_base + random.uniform(-5, 15)
-        memory = max(20, min(90, memory))
+    def _draw_noise(self, devices: List[SimulatedDevice]) -> List[tuple]:
+        """Draw metric noise for every device in one go (batched tick).
+
+        With numpy every column is a single vectorized draw; otherwise each
+        entry comes from that device's own ``rng``.
+        """
+        if _np_rng is None:
+            return [self._draw_device_noise(device.rng) for device in devices]
+
+        count = len(devices)
+
+        # tolist() yields native Python numbers the JSON encoders accept
+        return list(
+            zip(
+                _np_rng.uniform(-10, 30, count).tolist(),
+                _np_rng.uniform(-5, 15, count).tolist(),
+                _np_rng.uniform(-5, 15, count).tolist(),
+                _np_rng.uniform(0, 0.1, count).tolist(),
+                _np_rng.integers(20, 200, count, endpoint=True).tolist(),
+                (_np_rng.random(count) < self.detection_probability).tolist(),
+            )
+        )
 
-        temperature = device.temperature_base + random.uniform(-5, 15)
-        temperature = max(35, min(85, temperature))
+    def _simulate_metrics(
+        self, device: SimulatedDevice, noise: Optional[tuple] = None
+    ) -> Dict[str, Any]:
+        """Generate simulated telemetry metrics."""
+        if noise is None:
+            noise = self._draw_device_noise(device.rng)
+        cpu_noise, mem_noise, temp_noise, storage_incr, latency, detected = noise
+
+        # Add some variation to base values
+        cpu, memory, temperature = _mix_metrics(
+            device.cpu_base,
+            device.memory_base,
+            device.temperature_base,
+            cpu_noise,
+            mem_noise,
+            temp_noise,
+        )
 
         # Slowly increase storage over time
         device.storage_used = min(
-            device.storage_total * 0.9, device.storage_used + random.uniform(0, 0.1)
+            device.storage_total * 0.9, device.storage_used + storage_incr
         )
 
-        uptime = time.time() - device.start_time
+        # Monotonic, so wall-clock adjustments never skew reported uptime
+        uptime = time.monotonic() - device.start_time
 
         # Simulate occasional detections
-        if random.random() < self.detection_probability:
-            device.detection_count += random.randint(1, 3)
+        if detected:
+            device.detection_count += device.rng.randint(1, 3)
 
-        memory_total = random.choice([2048, 4096, 8192])
-        memory_used = memory_total * (memory / 100)
+        # Only the per-tick values change; the static fields were filled in
+        # when the device was created. Each device owns its tree, and a device
+        # never has two heartbeats in flight.
+        stats = device.stats
+        stats["uptime_seconds"] = uptime
+        stats["detection_count"] = device.detection_count
 
-        return {
-            "uptime_seconds": uptime,
-            "detection_count": device.detection_count,
-            "system": {
-                "cpu_percent": round(cpu, 1),
-                "memory_percent": round(memory, 1),
-                "memory_used_mb": round(memory_used, 1),
-                "memory_total_mb": memory_total,
-                "temperature_celsius": round(temperature, 1),
-                "disk_percent": round(
-                    (device.storage_used / device.storage_total) * 100, 1
-                ),
-                "disk_used_gb": round(device.storage_used, 2),
-                "disk_total_gb": device.storage_total,
-            },
-            "power": {
-                "consumption_watts": round(random.uniform(3, 8), 1),
-                "source": device.power_source,
-                "battery_percent": (
-                    random.randint(60, 100)
-                    if device.power_source == "battery"
-                    else None
-                ),
-            },
-            "cameras": device.cameras,
-            "network": {
-                "latency_ms": random.randint(20, 200),
-            },
-        }
+        system = stats["system"]
+        system["cpu_percent"] = cpu
+        system["memory_percent"] = memory
+        system["memory_used_mb"] = system["memory_total_mb"] * (memory / 100)
+        system["temperature_celsius"] = temperature
+        system["disk_percent"] = (device.storage_used / device.storage_total) * 100
+        system["disk_used_gb"] = device.storage_used
+
+        power = stats["power"]
+        power["consumption_watts"] = device.rng.uniform(3, 8)
+        if device.power_source == "battery":
+            power["battery_percent"] = device.rng.randint(60, 100)
+
+        stats["network"]["latency_ms"] = latency
+
+        return stats
 
     def _register_device(self, device: SimulatedDevice) -> bool:
         """Register a device with the dashboard."""
-        data = {
-            "device_id": device.device_id,
-            "name": device.name,
-            "location": device.location,
-            "environment": "production",
-            "version": "1.0.0",
-            "hardware_model": device.hardware_model,
-            "tags": [
-                "wildlife",
-                "simulation",
-                device.location["name"].split()[0].lower(),
-            ],
-            "cameras": device.cameras,
-        }
+        data = device.envelope
 
         response = self._make_request(
             "/api/devices", data=data, device_id=device.device_id
         )
 
         if response and response.get("success"):
-            print(
+            _log(
                 f"[{device.device_id}] Registered: {device.name} at {device.location['name']}"
             )
             return True
@@ -481,128 +733,228 @@ class DeviceSimulator:
 
     def _send_detection(self, device: SimulatedDevice) -> bool:
         """Send a simulated wildlife detection with image."""
-        wildlife = random.choice(self.wildlife_classes)
-        camera = random.choice(device.cameras)
+        wildlife = device.rng.choice(self.wildlife_classes)
+        skeleton = device.rng.choice(device.detection_skeletons)
 
-        detection_id = int(time.time() * 1000)
+        now_ns = time.time_ns()
+        now = now_ns // 1_000_000_000
+        detection_id = now_ns // 1_000_000
         event_id = f"evt-{detection_id}"
 
-        confidence = random.uniform(*wildlife["confidence_range"])
+        confidence = device.rng.uniform(*wildlife["confidence_range"])
         bbox = [
-            random.randint(50, 200),
-            random.randint(50, 200),
-            random.randint(300, 600),
-            random.randint(300, 600),
+            device.rng.randint(50, 200),
+            device.rng.randint(50, 200),
+            device.rng.randint(300, 600),
+            device.rng.randint(300, 600),
         ]
 
+        # Only the per-event fields are filled in; the rest comes from the
+        # camera's skeleton, whose nested dicts are never mutated
         data = {
+            **skeleton,
             "event_id": event_id,
             "detection_id": detection_id,
-            "device_id": device.device_id,
-            "camera_id": camera["id"],
-            "timestamp": time.time(),
+            "timestamp": now,
             "class_name": wildlife["name"],
-            "confidence": round(confidence, 3),
+            "confidence": confidence,
             "bbox": bbox,
-            "location": {
-                "latitude": device.location["latitude"],
-                "longitude": device.location["longitude"],
-                "name": device.location["name"],
-            },
             "metadata": {
-                "priority": "high" if wildlife["high_priority"] else "normal",
-                "processing_time_ms": random.randint(100, 500),
-                "model_version": "yolov8n",
-                "camera_name": camera["name"],
-                "animal_category": self.animal_category,
+                **skeleton["metadata"],
+                "priority": (
+                    PRIORITY_HIGH if wildlife["high_priority"] else PRIORITY_NORMAL
+                ),
+                "processing_time_ms": device.rng.randint(100, 500),
             },
         }
 
         # Select image that matches the wildlife class
-        if self.send_images and self._demo_images:
-            # Use the image specified for this wildlife class, or fallback to random
-            preferred_images = wildlife.get("images", list(self._demo_images.keys()))
-            available_images = [
-                img for img in preferred_images if img in self._demo_images
-            ]
-            if available_images:
-                image_name = random.choice(available_images)
-            else:
-                image_name = random.choice(list(self._demo_images.keys()))
-            data["image_base64"] = self._demo_images[image_name]
-
-        response = self._make_request(
-            "/api/devices/detections", data=data, device_id=device.device_id
-        )
+        image_name = None
+        images = self._class_images.get(wildlife["name"])
+        if self.send_images and images:
+            image_name = device.rng.choice(images)
+
+        if image_name and self.multipart_images:
+            response = self._make_request(
+                "/api/devices/detections",
+                device_id=device.device_id,
+                body=self._encode_multipart(data, image_name),
+                content_type="multipart/form-data; boundary="
+                + self._multipart_boundary,
+                timestamp=now,
+            )
+        else:
+            if image_name:
+                data["image_base64"] = self._demo_images_b64[image_name]
+            response = self._make_request(
+                "/api/devices/detections",
+                data=data,
+                device_id=device.device_id,
+                timestamp=now,
+            )
 
         if response and response.get("success"):
             device.detection_count += 1
             priority = "HIGH" if wildlife["high_priority"] else "NORM"
-            img_status = "with image" if "image_base64" in data else "no image"
-            print(
+            img_status = "with image" if image_name else "no image"
+            _log(
                 f"[{device.device_id}] Detection: {wildlife['name']} ({confidence:.2f}) [{priority}] {img_status}"
             )
             return True
         return False
 
+    def _heartbeat_data(
+        self, device: SimulatedDevice, stats: Dict[str, Any], now: int
+    ) -> Dict[str, Any]:
+        """Build the heartbeat payload for a device."""
+        return {
+            **device.envelope,
+            "timestamp": now,
+            "status": STATUS_ONLINE,
+            "stats": stats,
+        }
+
+    def _print_heartbeat(self, device: SimulatedDevice, stats: Dict[str, Any]):
+        """Log a heartbeat the dashboard accepted."""
+        cpu = stats["system"]["cpu_percent"]
+        mem = stats["system"]["memory_percent"]
+        temp = stats["system"]["temperature_celsius"]
+        _log(
+            f"[{device.device_id}] Heartbeat: CPU={cpu:.1f}%, MEM={mem:.1f}%, TEMP={temp:.1f}°C, Detections={device.detection_count}"
+        )
+
     def _send_heartbeat(self, device: SimulatedDevice) -> bool:
         """Send a heartbeat for a device."""
+        now = time.time_ns() // 1_000_000_000
         stats = self._simulate_metrics(device)
+        data = self._heartbeat_data(device, stats, now)
+
+        response = self._make_request(
+            "/api/devices/heartbeat",
+            data=data,
+            device_id=device.device_id,
+            timestamp=now,
+        )
 
+        if response and response.get("success"):
+            self._print_heartbeat(device, stats)
+            return True
+        return False
+
+    def _send_batched_heartbeats(self) -> bool:
+        """Send one heartbeat for every device in a single request."""
+        # One clock reading stamps every heartbeat in the batch
+        now = time.time_ns() // 1_000_000_000
+        all_stats = [
+            self._simulate_metrics(device, noise)
+            for device, noise in zip(self.devices, self._draw_noise(self.devices))
+        ]
         data = {
-            "device_id": device.device_id,
-            "timestamp": time.time(),
-            "status": "online",
-            "name": device.name,
-            "location": device.location,
-            "environment": "production",
-            "version": "1.0.0",
-            "hardware_model": device.hardware_model,
-            "tags": [
-                "wildlife",
-                "simulation",
-                device.location["name"].split()[0].lower(),
-            ],
-            "cameras": device.cameras,
-            "stats": stats,
+            "heartbeats": [
+                self._heartbeat_data(device, stats, now)
+                for device, stats in zip(self.devices, all_stats)
+            ]
         }
 
         response = self._make_request(
-            "/api/devices/heartbeat", data=data, device_id=device.device_id
+            "/api/devices/heartbeat/batch",
+            data=data,
+            device_id=BATCH_DEVICE_ID,
+            timestamp=now,
         )
 
         if response and response.get("success"):
-            cpu = stats["system"]["cpu_percent"]
-            mem = stats["system"]["memory_percent"]
-            temp = stats["system"]["temperature_celsius"]
-            print(
-                f"[{device.device_id}] Heartbeat: CPU={cpu}%, MEM={mem}%, TEMP={temp}°C, Detections={device.detection_count}"
-            )
+            for device, stats in zip(self.devices, all_stats):
+                self._print_heartbeat(device, stats)
             return True
         return False
 
-    def _device_loop(self, device: SimulatedDevice):
-        """Main loop for a simulated device."""
-        # Register device first
-        if not self._register_device(device):
-            print(f"[{device.device_id}] Failed to register, retrying...")
-            time.sleep(5)
-            if not self._register_device(device):
+    async def _register_devices(self) -> List[SimulatedDevice]:
+        """Register every device concurrently, retrying failures once."""
+        loop = asyncio.get_running_loop()
+
+        async def register_all(devices):
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(None, self._register_device, device)
+                    for device in devices
+                )
+            )
+            return [d for d, ok in zip(devices, results) if not ok]
+
+        failed = await register_all(self.devices)
+        if failed:
+            for device in failed:
+                print(f"[{device.device_id}] Failed to register, retrying...")
+            if await self._wait_for_stop(5):
+                return []
+            failed = await register_all(failed)
+            for device in failed:
                 print(f"[{device.device_id}] Registration failed, exiting")
-                return
 
-        # Send heartbeats and detections
-        while not self._stop_event.is_set():
-            self._send_heartbeat(device)
+        return [d for d in self.devices if d not in failed]
+
+    def _tick_device(self, device: SimulatedDevice):
+        """Send one device's heartbeat and maybe a detection."""
+        self._send_heartbeat(device)
+
+        # Randomly trigger detection
+        if device.rng.random() < self.detection_probability:
+            self._send_detection(device)
+
+    async def _scheduler_loop(self):
+        """Tick every device from one timer on a shared interval boundary.
 
-            # Randomly trigger detection
-            if random.random() < self.detection_probability:
-                self._send_detection(device)
+        The blocking HTTP calls are handed to the loop's worker threads, so
+        idle devices hold neither a thread nor a timer of their own.
+        """
+        loop = asyncio.get_running_loop()
 
-            self._stop_event.wait(self.heartbeat_interval)
+        # Unregistered devices are dropped so batches only carry known ones
+        self.devices = devices = await self._register_devices()
+        if not devices:
+            return
+
+        mode = "batched heartbeats" if self.batch_heartbeats else "heartbeats"
+        print(
+            f"\nAll {len(devices)} devices started ({mode}). Press Ctrl+C to stop.\n"
+        )
+
+        next_tick = loop.time()
+        while not self._stop_event.is_set():
+            if self.batch_heartbeats:
+                await loop.run_in_executor(None, self._send_batched_heartbeats)
+
+                # Detections stay per-device since each carries its own image
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(None, self._send_detection, device)
+                        for device in devices
+                        if device.rng.random() < self.detection_probability
+                    )
+                )
+            else:
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(None, self._tick_device, device)
+                        for device in devices
+                    )
+                )
+
+            # Fixed boundaries, so a slow tick does not push the next one out
+            next_tick += self.heartbeat_interval
+            await self._wait_for_stop(max(0.0, next_tick - loop.time()))
+
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Sleep up to ``timeout`` seconds; return True if a stop was requested."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     def start(self):
-        """Start the device simulator."""
+        """Print the run configuration and create the simulated devices."""
         print("\n" + "=" * 60)
         print("OPTIC-SHIELD Device Simulator")
         print("=" * 60)
@@ -615,6 +967,8 @@ class DeviceSimulator:
             f"Wildlife Classes: {', '.join([w['name'] for w in self.wildlife_classes])}"
         )
         print(f"Send Images: {self.send_images}")
+        print(f"Batch Heartbeats: {self.batch_heartbeats}")
+        print(f"Multipart Images: {self.multipart_images}")
         print("=" * 60 + "\n")
 
         # Load demo images
@@ -631,41 +985,38 @@ class DeviceSimulator:
             print(f"  Cameras: {len(device.cameras)}")
             print()
 
-        # Start device threads
-        for device in self.devices:
-            thread = threading.Thread(
-                target=self._device_loop,
-                args=(device,),
-                name=f"Device-{device.device_id}",
-                daemon=True,
+    async def _run_async(self):
+        """Run the device scheduler on a single event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+
+        # A fixed-size pool, so the thread count (and the keep-alive
+        # connection each worker holds) stays capped however many devices run
+        self._loop.set_default_executor(
+            ThreadPoolExecutor(
+                max_workers=min(32, max(1, self.num_devices)),
+                thread_name_prefix="device-worker",
             )
-            thread.start()
-            self._threads.append(thread)
-            time.sleep(0.5)  # Stagger device starts
+        )
 
-        print(f"\nAll {self.num_devices} devices started. Press Ctrl+C to stop.\n")
+        await self._scheduler_loop()
 
     def stop(self):
-        """Stop the device simulator."""
-        print("\nStopping simulator...")
-        self._stop_event.set()
-
-        for thread in self._threads:
-            thread.join(timeout=5)
-
-        print("Simulator stopped.")
+        """Ask all device loops to finish; safe to call from any thread."""
+        if self._loop is not None and self._stop_event is not None:
+            self._loop.call_soon_threadsafe(self._stop_event.set)
 
     def run(self):
         """Run the simulator until interrupted."""
         self.start()
 
         try:
-            while True:
-                time.sleep(1)
+            asyncio.run(self._run_async())
         except KeyboardInterrupt:
-            pass
+            # asyncio.run has already cancelled the device tasks
+            print("\nStopping simulator...")
         finally:
-            self.stop()
+            print("Simulator stopped.")
 
 
 def main():
@@ -702,6 +1053,18 @@ def main():
         help=f"Animal category to simulate detections for. Choices: {ANIMAL_CATEGORIES} (default: leopard)",
     )
 
+    parser.add_argument(
+        "--batch-heartbeats",
+        action="store_true",
+        help="Send all device heartbeats in one request per interval",
+    )
+
+    parser.add_argument(
+        "--multipart",
+        action="store_true",
+        help="Upload detection images as raw multipart/form-data parts",
+    )
+
     args = parser.parse_args()
 
     simulator = DeviceSimulator(
@@ -711,6 +1074,8 @@ def main():
         heartbeat_interval=args.interval,
         detection_probability=args.detection_rate,
         animal_category=args.animal_category,
+        batch_heartbeats=args.batch_heartbeats,
+        multipart_images=args.multipart,
     )
 
     simulator.run()
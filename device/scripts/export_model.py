@@ -6,9 +6,79 @@ Run this script on your development machine before deploying to Pi.
 
 import os
 import sys
+import argparse
+import shutil
+import subprocess
 from pathlib import Path
 
-def export_to_ncnn():
+# Must match detection.input_size in config.yaml
+INPUT_SIZE = 224
+
+# Ultralytics feeds RGB scaled to [0, 1]; the calibration must match
+CALIBRATION_ARGS = [
+    "mean=[0,0,0]",
+    "norm=[0.003922,0.003922,0.003922]",
+    f"shape=[{INPUT_SIZE},{INPUT_SIZE},3]",
+    "pixel=RGB",
+    "thread=4",
+    "method=kl",
+]
+
+CALIBRATION_EXTENSIONS = {".jpg", ".jpeg", ".png"}
+
+
+def quantize_int8(ncnn_dir: Path, calibration_dir: Path) -> Path:
+    """
+    Build an INT8 copy of an NCNN model with ncnn2table + ncnn2int8.
+    
+    The ncnn tools must be on PATH. Build ncnn with -DNCNN_ARM82DOT=ON so
+    the Cortex-A76 (Pi 5) SDOT kernels are used for the INT8 layers.
+    """
+    for tool in ("ncnn2table", "ncnn2int8"):
+        if shutil.which(tool) is None:
+            raise RuntimeError(f"{tool} not found on PATH (build ncnn with tools enabled)")
+    
+    images = sorted(
+        p for p in calibration_dir.iterdir()
+        if p.suffix.lower() in CALIBRATION_EXTENSIONS
+    )
+    if not images:
+        raise RuntimeError(f"No calibration images found in {calibration_dir}")
+    
+    param = next(ncnn_dir.glob("*.param"))
+    weights = param.with_suffix(".bin")
+    
+    int8_dir = ncnn_dir.with_name(
+        ncnn_dir.name[:-len("_ncnn_model")] + "_int8_ncnn_model"
+    )
+    int8_dir.mkdir(parents=True, exist_ok=True)
+    
+    image_list = int8_dir / "calibration.txt"
+    image_list.write_text("\n".join(str(p.resolve()) for p in images) + "\n")
+    table = int8_dir / "model.table"
+    
+    subprocess.run(
+        ["ncnn2table", str(param), str(weights), str(image_list), str(table)]
+        + CALIBRATION_ARGS,
+        check=True,
+    )
+    # Keep Ultralytics' file names so the directory loads like the FP model
+    subprocess.run(
+        [
+            "ncnn2int8", str(param), str(weights),
+            str(int8_dir / param.name), str(int8_dir / weights.name), str(table),
+        ],
+        check=True,
+    )
+    
+    metadata = ncnn_dir / "metadata.yaml"
+    if metadata.exists():
+        shutil.copy(metadata, int8_dir / metadata.name)
+    
+    return int8_dir
+
+
+def export_to_ncnn(calibration_dir: Path = None):
     """Export YOLO11n to NCNN format."""
     try:
         from ultralytics import YOLO
@@ -24,26 +94,33 @@ def export_to_ncnn():
         print("\n[1/3] Loading YOLO11n model...")
         model = YOLO("yolo11n.pt")
         
-        print("\n[2/3] Exporting to NCNN format...")
+        print(f"\n[2/3] Exporting to NCNN format ({INPUT_SIZE}x{INPUT_SIZE}, FP16)...")
         print("This may take a few minutes...")
         
-        ncnn_path = model.export(format="ncnn")
+        ncnn_path = model.export(format="ncnn", imgsz=INPUT_SIZE, half=True)
         
         print(f"\n[3/3] Model exported successfully!")
         print(f"NCNN model saved to: {ncnn_path}")
         
         target_path = models_dir / "yolo11n_ncnn_model"
-        if Path(ncnn_path).exists() and not target_path.exists():
-            import shutil
+        if Path(ncnn_path).exists() and Path(ncnn_path).resolve() != target_path.resolve():
+            # Replace any earlier export so the model matches INPUT_SIZE
+            if target_path.exists():
+                shutil.rmtree(target_path)
+                print(f"Replaced previous export at: {target_path}")
             shutil.move(ncnn_path, target_path)
             print(f"Moved to: {target_path}")
         
         pt_path = models_dir / "yolo11n.pt"
         if not pt_path.exists():
-            import shutil
             shutil.copy("yolo11n.pt", pt_path)
             print(f"Copied PyTorch model to: {pt_path}")
         
+        if calibration_dir:
+            print(f"\nQuantizing to INT8 with images from: {calibration_dir}")
+            int8_path = quantize_int8(target_path, calibration_dir)
+            print(f"INT8 model saved to: {int8_path}")
+        
         print("\n" + "=" * 60)
         print("Export complete! You can now deploy to Raspberry Pi.")
         print("=" * 60)
@@ -58,4 +135,13 @@ def export_to_ncnn():
 
 
 if __name__ == "__main__":
-    export_to_ncnn()
+    parser = argparse.ArgumentParser(description="Export YOLO11n to NCNN")
+    parser.add_argument(
+        "--int8",
+        type=Path,
+        default=None,
+        metavar="CALIBRATION_DIR",
+        help="Also build an INT8 model calibrated on ~200 representative frames",
+    )
+    args = parser.parse_args()
+    export_to_ncnn(args.int8)
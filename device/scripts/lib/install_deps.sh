@@ -69,6 +69,7 @@ install_rpi_system_deps() {
         python3-pip \
         python3-venv \
         python3-dev \
+        libyaml-dev \
         git \
         curl \
         wget
@@ -102,6 +103,7 @@ install_linux_system_deps() {
             python3-pip \
             python3-venv \
             python3-dev \
+            libyaml-dev \
             git \
             curl \
             libopencv-dev \
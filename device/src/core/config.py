@@ -6,13 +6,21 @@ Integrates with platform detection for auto-configuration.
 
 import os
 import uuid
+import pickle
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional, TYPE_CHECKING
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 
 import yaml
 
+# libyaml's C loader parses several times faster; PyYAML built without it
+# only ships the pure-Python SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
 # Lazy import to avoid circular dependencies
@@ -22,16 +30,22 @@ if TYPE_CHECKING:
 
 def deep_merge(base: Dict, override: Dict) -> Dict:
     """Deep merge two dictionaries, with override taking precedence."""
+    # Iterative, copying only the subtrees that are actually merged into
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                dst[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                dst[key] = value
     return result
 
 
-@dataclass
+@dataclass(frozen=True)
 class DeviceConfig:
     id: str = ""
     name: str = "optic-shield-001"
@@ -40,7 +54,7 @@ class DeviceConfig:
     longitude: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfig:
     path: str = "models/yolo11n_ncnn_model"
     fallback_path: str = "models/yolo11n.pt"
@@ -49,19 +63,19 @@ class ModelConfig:
     max_detections: int = 10
 
 
-@dataclass
+@dataclass(frozen=True)
 class DetectionConfig:
     model: ModelConfig = field(default_factory=ModelConfig)
     target_classes: list = field(
         default_factory=lambda: [15, 16, 17, 18, 19, 20, 21, 22, 23]
     )
-    input_size: int = 640
+    input_size: int = 224
     batch_size: int = 1
     use_ncnn: bool = True
     num_threads: int = 4
 
 
-@dataclass
+@dataclass(frozen=True)
 class CameraConfig:
     enabled: bool = True
     width: int = 640
@@ -73,13 +87,13 @@ class CameraConfig:
     usb_device_id: int = 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     path: str = "data/detections.db"
     max_size_mb: int = 500
 
 
-@dataclass
+@dataclass(frozen=True)
 class ImageStorageConfig:
     path: str = "data/images"
     save_detections: bool = True
@@ -88,7 +102,7 @@ class ImageStorageConfig:
     cleanup_days: int = 30
 
 
-@dataclass
+@dataclass(frozen=True)
 class StorageConfig:
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     images: ImageStorageConfig = field(default_factory=ImageStorageConfig)
@@ -97,14 +111,14 @@ class StorageConfig:
     logs_retention_days: int = 7
 
 
-@dataclass
+@dataclass(frozen=True)
 class LocalAlertConfig:
     gpio_enabled: bool = False
     gpio_pin: int = 17
     buzzer_duration_ms: int = 500
 
 
-@dataclass
+@dataclass(frozen=True)
 class RemoteAlertConfig:
     enabled: bool = True
     include_image: bool = True
@@ -113,7 +127,7 @@ class RemoteAlertConfig:
     retry_delay_seconds: int = 5
 
 
-@dataclass
+@dataclass(frozen=True)
 class AlertConfig:
     enabled: bool = True
     cooldown_seconds: int = 60
@@ -121,7 +135,7 @@ class AlertConfig:
     remote: RemoteAlertConfig = field(default_factory=RemoteAlertConfig)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DashboardConfig:
     api_url: str = ""
     api_key: str = ""
@@ -132,13 +146,13 @@ class DashboardConfig:
     offline_queue_max_size: int = 1000
 
 
-@dataclass
+@dataclass(frozen=True)
 class WatchdogConfig:
     enabled: bool = True
     timeout_seconds: int = 30
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemConfig:
     watchdog: WatchdogConfig = field(default_factory=WatchdogConfig)
     auto_restart: bool = True
@@ -149,7 +163,7 @@ class SystemConfig:
     shutdown_timeout_seconds: int = 10
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     level: str = "INFO"
     format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -158,6 +172,62 @@ class LoggingConfig:
     file_path: str = "logs/optic-shield.log"
 
 
+# Fields whose YAML value lives under a nested key rather than the field name
+_FIELD_ALIASES: Dict[type, Dict[str, tuple]] = {
+    DeviceConfig: {
+        "location_name": ("location", "name"),
+        "latitude": ("location", "latitude"),
+        "longitude": ("location", "longitude"),
+    },
+    CameraConfig: {
+        "width": ("resolution", "width"),
+        "height": ("resolution", "height"),
+    },
+    StorageConfig: {
+        "logs_path": ("logs", "path"),
+        "logs_max_size_mb": ("logs", "max_size_mb"),
+        "logs_retention_days": ("logs", "retention_days"),
+    },
+}
+
+# (Config attribute, YAML section, dataclass) for each top-level section
+_CONFIG_SECTIONS = (
+    ("device", "device", DeviceConfig),
+    ("detection", "detection", DetectionConfig),
+    ("camera", "camera", CameraConfig),
+    ("storage", "storage", StorageConfig),
+    ("alerts", "alerts", AlertConfig),
+    ("dashboard", "dashboard", DashboardConfig),
+    ("system", "system", SystemConfig),
+    ("logging", "logging", LoggingConfig),
+)
+
+
+def _from_dict(cls: type, data: Dict[str, Any]) -> Any:
+    """Build a config dataclass from a YAML mapping.
+
+    Missing or null values fall back to the dataclass defaults, and nested
+    dataclass fields are built recursively from their sub-mappings.
+    """
+    aliases = _FIELD_ALIASES.get(cls, {})
+    kwargs = {}
+    for f in fields(cls):
+        path = aliases.get(f.name)
+        if path is None:
+            value = data.get(f.name)
+        else:
+            value = data
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+
+        if value is None:
+            continue
+        if is_dataclass(f.type) and isinstance(value, dict):
+            value = _from_dict(f.type, value)
+        kwargs[f.name] = value
+    return cls(**kwargs)
+
+
 class Config:
     """Main configuration class with environment support."""
 
@@ -167,6 +237,7 @@ class Config:
         self.config_dir = config_dir or Path(__file__).parent.parent.parent / "config"
         self.environment = os.getenv("OPTIC_ENV", "development")
         self._raw_config: Dict[str, Any] = {}
+        self._platform_info_cache: Optional[Dict[str, Any]] = None
 
         self.device = DeviceConfig()
         self.detection = DetectionConfig()
@@ -181,6 +252,12 @@ class Config:
         self._apply_env_overrides()
         self._ensure_device_id()
 
+        # Resolved once; the path getters are called from hot logging and
+        # image-saving paths
+        self._base_path = Path(__file__).parent.parent.parent
+        self._data_path = self._base_path / "data"
+        self._logs_path = self._base_path / self.storage.logs_path
+
     @classmethod
     def get_instance(cls, config_dir: Optional[Path] = None) -> "Config":
         """Get singleton instance of Config."""
@@ -202,173 +279,91 @@ class Config:
         self._parse_config()
 
     def _load_yaml(self, filename: str) -> Dict[str, Any]:
-        """Load a YAML configuration file."""
+        """Load a YAML configuration file, reusing a pickled parse if unchanged."""
         filepath = self.config_dir / filename
-        if not filepath.exists():
+        try:
+            stat = filepath.stat()
+        except FileNotFoundError:
             logger.warning(f"Config file not found: {filepath}")
             return {}
 
+        # The cache is only valid for the exact file version it was parsed from
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cache_path = filepath.with_name(filepath.name + ".cache")
+        cached = self._read_yaml_cache(cache_path, cache_key)
+        if cached is not None:
+            return cached
+
         try:
             with open(filepath, "r") as f:
-                return yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             logger.error(f"Error loading config file {filepath}: {e}")
             return {}
 
+        self._write_yaml_cache(cache_path, cache_key, data)
+        return data
+
+    @staticmethod
+    def _read_yaml_cache(
+        cache_path: Path, cache_key: tuple
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached parse if it matches cache_key, else None."""
+        try:
+            with open(cache_path, "rb") as f:
+                key, data = pickle.load(f)
+        except Exception:
+            return None
+        return data if key == cache_key else None
+
+    @staticmethod
+    def _write_yaml_cache(cache_path: Path, cache_key: tuple, data: Dict[str, Any]):
+        """Atomically store a parsed config next to its YAML file."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((cache_key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            # A read-only config dir just means parsing YAML every time
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _parse_config(self):
         """Parse raw config into dataclass objects."""
         cfg = self._raw_config
 
-        if "device" in cfg:
-            d = cfg["device"]
-            loc = d.get("location", {})
-            self.device = DeviceConfig(
-                id=d.get("id", ""),
-                name=d.get("name", "optic-shield-001"),
-                location_name=loc.get("name", "Unknown Location"),
-                latitude=loc.get("latitude", 0.0),
-                longitude=loc.get("longitude", 0.0),
-            )
-
-        if "detection" in cfg:
-            d = cfg["detection"]
-            m = d.get("model", {})
-            self.detection = DetectionConfig(
-                model=ModelConfig(
-                    path=m.get("path", "models/yolo11n_ncnn_model"),
-                    fallback_path=m.get("fallback_path", "models/yolo11n.pt"),
-                    confidence_threshold=m.get("confidence_threshold", 0.5),
-                    iou_threshold=m.get("iou_threshold", 0.45),
-                    max_detections=m.get("max_detections", 10),
-                ),
-                target_classes=d.get(
-                    "target_classes", [14, 15, 16, 17, 18, 19, 20, 21, 22, 23]
-                ),
-                input_size=d.get("input_size", 640),
-                batch_size=d.get("batch_size", 1),
-                use_ncnn=d.get("use_ncnn", True),
-                num_threads=d.get("num_threads", 4),
-            )
-
-        if "camera" in cfg:
-            c = cfg["camera"]
-            res = c.get("resolution", {})
-            self.camera = CameraConfig(
-                enabled=c.get("enabled", True),
-                width=res.get("width", 640),
-                height=res.get("height", 480),
-                format=c.get("format", "RGB888"),
-                fps=c.get("fps", 10),
-                rotation=c.get("rotation", 0),
-                fallback_usb=c.get("fallback_usb", True),
-                usb_device_id=c.get("usb_device_id", 0),
-            )
-
-        if "storage" in cfg:
-            s = cfg["storage"]
-            db = s.get("database", {})
-            img = s.get("images", {})
-            logs = s.get("logs", {})
-            self.storage = StorageConfig(
-                database=DatabaseConfig(
-                    path=db.get("path", "data/detections.db"),
-                    max_size_mb=db.get("max_size_mb", 500),
-                ),
-                images=ImageStorageConfig(
-                    path=img.get("path", "data/images"),
-                    save_detections=img.get("save_detections", True),
-                    jpeg_quality=img.get("jpeg_quality", 85),
-                    max_storage_mb=img.get("max_storage_mb", 2000),
-                    cleanup_days=img.get("cleanup_days", 30),
-                ),
-                logs_path=logs.get("path", "logs"),
-                logs_max_size_mb=logs.get("max_size_mb", 100),
-                logs_retention_days=logs.get("retention_days", 7),
-            )
-
-        if "alerts" in cfg:
-            a = cfg["alerts"]
-            loc = a.get("local", {})
-            rem = a.get("remote", {})
-            self.alerts = AlertConfig(
-                enabled=a.get("enabled", True),
-                cooldown_seconds=a.get("cooldown_seconds", 60),
-                local=LocalAlertConfig(
-                    gpio_enabled=loc.get("gpio_enabled", False),
-                    gpio_pin=loc.get("gpio_pin", 17),
-                    buzzer_duration_ms=loc.get("buzzer_duration_ms", 500),
-                ),
-                remote=RemoteAlertConfig(
-                    enabled=rem.get("enabled", True),
-                    include_image=rem.get("include_image", True),
-                    image_max_size_kb=rem.get("image_max_size_kb", 100),
-                    retry_attempts=rem.get("retry_attempts", 3),
-                    retry_delay_seconds=rem.get("retry_delay_seconds", 5),
-                ),
-            )
-
-        if "dashboard" in cfg:
-            d = cfg["dashboard"]
-            self.dashboard = DashboardConfig(
-                api_url=d.get("api_url", ""),
-                api_key=d.get("api_key", ""),
-                websocket_enabled=d.get("websocket_enabled", True),
-                websocket_url=d.get("websocket_url", ""),
-                sync_interval_seconds=d.get("sync_interval_seconds", 300),
-                heartbeat_interval_seconds=d.get("heartbeat_interval_seconds", 60),
-                offline_queue_max_size=d.get("offline_queue_max_size", 1000),
-            )
-
-        if "system" in cfg:
-            s = cfg["system"]
-            w = s.get("watchdog", {})
-            self.system = SystemConfig(
-                watchdog=WatchdogConfig(
-                    enabled=w.get("enabled", True),
-                    timeout_seconds=w.get("timeout_seconds", 30),
-                ),
-                auto_restart=s.get("auto_restart", True),
-                max_restart_attempts=s.get("max_restart_attempts", 5),
-                restart_delay_seconds=s.get("restart_delay_seconds", 10),
-                max_memory_mb=s.get("max_memory_mb", 512),
-                max_cpu_percent=s.get("max_cpu_percent", 80),
-                shutdown_timeout_seconds=s.get("shutdown_timeout_seconds", 10),
-            )
-
-        if "logging" in cfg:
-            l = cfg["logging"]
-            self.logging = LoggingConfig(
-                level=l.get("level", "INFO"),
-                format=l.get(
-                    "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-                ),
-                console=l.get("console", True),
-                file=l.get("file", True),
-                file_path=l.get("file_path", "logs/optic-shield.log"),
-            )
+        for attr, section, cls in _CONFIG_SECTIONS:
+            if section in cfg:
+                setattr(self, attr, _from_dict(cls, cfg[section]))
 
     def _apply_env_overrides(self):
         """Apply environment variable overrides."""
-        if os.getenv("OPTIC_API_KEY"):
-            self.dashboard.api_key = os.getenv("OPTIC_API_KEY")
+        # Section dataclasses are frozen, so overrides swap in updated copies
+        env = os.environ
+        if api_key := env.get("OPTIC_API_KEY"):
+            self.dashboard = replace(self.dashboard, api_key=api_key)
 
-        if os.getenv("OPTIC_DASHBOARD_URL"):
-            url = os.getenv("OPTIC_DASHBOARD_URL")
-            self.dashboard.api_url = f"{url}/api"
+        if url := env.get("OPTIC_DASHBOARD_URL"):
             ws_url = url.replace("https://", "wss://").replace("http://", "ws://")
-            self.dashboard.websocket_url = f"{ws_url}/ws"
+            self.dashboard = replace(
+                self.dashboard, api_url=f"{url}/api", websocket_url=f"{ws_url}/ws"
+            )
 
-        if os.getenv("OPTIC_DEVICE_ID"):
-            self.device.id = os.getenv("OPTIC_DEVICE_ID")
+        if device_id := env.get("OPTIC_DEVICE_ID"):
+            self.device = replace(self.device, id=device_id)
 
     def _ensure_device_id(self):
         """Ensure device has a unique ID."""
         if not self.device.id:
             id_file = self.config_dir / ".device_id"
             if id_file.exists():
-                self.device.id = id_file.read_text().strip()
+                self.device = replace(self.device, id=id_file.read_text().strip())
             else:
-                self.device.id = str(uuid.uuid4())[:8]
+                self.device = replace(self.device, id=str(uuid.uuid4())[:8])
                 id_file.parent.mkdir(parents=True, exist_ok=True)
                 id_file.write_text(self.device.id)
 
@@ -382,23 +377,32 @@ class Config:
 
     def get_base_path(self) -> Path:
         """Get base path for the device service."""
-        return Path(__file__).parent.parent.parent
+        return self._base_path
 
     def get_data_path(self) -> Path:
         """Get data directory path."""
-        return self.get_base_path() / "data"
+        return self._data_path
 
     def get_logs_path(self) -> Path:
         """Get logs directory path."""
-        return self.get_base_path() / self.storage.logs_path
+        return self._logs_path
 
     def get_platform_info(self) -> Dict[str, Any]:
-        """Get platform detection information."""
+        """Get platform detection information (probed once, then cached)."""
+        if self._platform_info_cache is not None:
+            return self._platform_info_cache
+
         try:
             from src.utils.platform_detector import get_detector
 
             detector = get_detector(self.get_base_path())
-            return detector.get_full_report()
+            self._platform_info_cache = detector.get_full_report()
+            return self._platform_info_cache
         except Exception as e:
+            # Not cached, so a transient failure is retried on the next call
             logger.warning(f"Could not get platform info: {e}")
             return {"error": str(e)}
+
+    def invalidate_platform_info(self):
+        """Drop the cached platform report (for testing)."""
+        self._platform_info_cache = None
@@ -9,13 +9,19 @@ from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 import threading
+from collections import deque
 
 import numpy as np
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class Detection:
     """Represents a single detection result."""
     class_id: int
@@ -38,6 +44,10 @@ class WildlifeDetector:
     """
     Wildlife detection engine using YOLO11n.
     Optimized for Raspberry Pi 5 with NCNN backend.
+    
+    detect() must only be called from a single thread (the capture loop);
+    feed frames from other producers through a queue into that thread
+    instead of calling it concurrently. The lock only guards unload().
     """
     
     WILD_CAT_CLASSES = {
@@ -52,6 +62,9 @@ class WildlifeDetector:
         23: "lynx"
     }
     
+    # Upper bound on model class ids covered by the target lookup table
+    MAX_CLASSES = 1024
+    
     def __init__(
         self,
         model_path: str,
@@ -60,21 +73,38 @@ class WildlifeDetector:
         iou_threshold: float = 0.45,
         target_classes: Optional[List[int]] = None,
         use_ncnn: bool = True,
-        num_threads: int = 4
+        num_threads: int = 4,
+        input_size: int = 224
     ):
         self.model_path = Path(model_path)
         self.fallback_path = Path(fallback_path) if fallback_path else None
         self.confidence_threshold = confidence_threshold
         self.iou_threshold = iou_threshold
         self.target_classes = target_classes or list(self.WILD_CAT_CLASSES.keys())
+        # class_id -> is-target lookup table, indexed directly by box class
+        self._target_lut = np.zeros(
+            max(self.MAX_CLASSES, max(self.target_classes, default=0) + 1), dtype=bool
+        )
+        self._target_lut[self.target_classes] = True
         self.use_ncnn = use_ncnn
         self.num_threads = num_threads
+        self.imgsz = input_size
         
         self.model = None
         self.model_loaded = False
+        self.quant = "fp32"
+        self._class_names: List[str] = []
+        # Model-sized input buffers, one per batch slot, reused every frame
+        # (slot 0 doubles as the warmup frame and get_input_buffer())
+        self._input_bufs: List[np.ndarray] = [
+            np.zeros((self.imgsz, self.imgsz, 3), dtype=np.uint8)
+        ]
         self._lock = threading.Lock()
-        self._inference_times: List[float] = []
+        self._detect_thread: Optional[int] = None
         self._max_inference_history = 100
+        self._inference_times: deque = deque(maxlen=self._max_inference_history)
+        # Integer nanoseconds; converted to ms only when reported
+        self._inference_sum_ns = 0
         
     def load_model(self) -> bool:
         """Load the YOLO model with fallback support."""
@@ -82,20 +112,35 @@ class WildlifeDetector:
             from ultralytics import YOLO
             
             model_to_load = None
+            export_ncnn = False
             
-            if self.model_path.exists():
+            int8_path = self._int8_model_path()
+            
+            if self.use_ncnn and int8_path and int8_path.exists():
+                model_to_load = str(int8_path)
+                self.quant = "int8"
+                logger.info(f"Loading INT8 model from: {int8_path}")
+            elif self.model_path.exists():
                 model_to_load = str(self.model_path)
+                if self.use_ncnn:
+                    self.quant = "fp16"
                 logger.info(f"Loading model from: {self.model_path}")
             elif self.fallback_path and self.fallback_path.exists():
                 model_to_load = str(self.fallback_path)
                 logger.warning(f"Primary model not found, using fallback: {self.fallback_path}")
+                export_ncnn = self.use_ncnn
                 self.use_ncnn = False
             else:
                 logger.info("No local model found, downloading yolo11n.pt...")
                 model_to_load = "yolo11n.pt"
+                export_ncnn = self.use_ncnn
                 self.use_ncnn = False
             
+            if export_ncnn:
+                model_to_load = self._export_ncnn(YOLO(model_to_load), model_to_load)
+            
             self.model = YOLO(model_to_load)
+            self._class_names = self._build_class_names(self.model.names)
             self.model_loaded = True
             
             self._warmup()
@@ -108,92 +153,275 @@ class WildlifeDetector:
             self.model_loaded = False
             return False
     
+    def _build_class_names(self, names: Dict[int, str]) -> List[str]:
+        """Dense class_id -> name table, wild cat names taking precedence."""
+        size = max(max(names, default=-1), max(self.target_classes, default=-1)) + 1
+        return [
+            self.WILD_CAT_CLASSES.get(i, names.get(i, f"class_{i}"))
+            for i in range(size)
+        ]
+    
+    def _int8_model_path(self) -> Optional[Path]:
+        """
+        Path of the INT8-quantized NCNN model produced by export_model.py --int8.
+        
+        Kept as a sibling directory whose name still ends in "_ncnn_model" so
+        Ultralytics picks the NCNN backend for it.
+        """
+        name = self.model_path.name
+        if not name.endswith("_ncnn_model"):
+            return None
+        return self.model_path.with_name(name[:-len("_ncnn_model")] + "_int8_ncnn_model")
+    
+    def _export_ncnn(self, model, source: str) -> str:
+        """
+        Export a PyTorch model to NCNN at the fixed detector input size.
+        
+        The export is written to the primary model path so later startups
+        load it directly instead of exporting again.
+        """
+        try:
+            exported = Path(model.export(format="ncnn", imgsz=self.imgsz, half=True))
+            if exported.resolve() != self.model_path.resolve():
+                self.model_path.parent.mkdir(parents=True, exist_ok=True)
+                exported.replace(self.model_path)
+            self.use_ncnn = True
+            self.quant = "fp16"
+            logger.info(f"Exported NCNN model ({self.imgsz}px) to: {self.model_path}")
+            return str(self.model_path)
+        except Exception as e:
+            logger.warning(f"NCNN export failed, using PyTorch model: {e}")
+            return source
+    
     def _warmup(self):
-        """Warm up the model with a dummy inference."""
+        """
+        Warm up the model with dummy inferences at the real input shape.
+        
+        Runs twice so NCNN has finished kernel selection before the first
+        real frame, using the shared input buffer instead of a new array.
+        """
         if not self.model:
             return
         
         try:
-            dummy_image = np.zeros((480, 640, 3), dtype=np.uint8)
-            self.model(dummy_image, verbose=False)
+            dummy_image = self._input_bufs[0]
+            dummy_image.fill(0)
+            for _ in range(2):
+                self.model(dummy_image, imgsz=self.imgsz, verbose=False)
             logger.debug("Model warmup completed")
         except Exception as e:
             logger.warning(f"Model warmup failed: {e}")
     
-    def detect(self, frame: np.ndarray) -> List[Detection]:
+    def detect(self, frame: Optional[np.ndarray] = None) -> List[Detection]:
         """
         Run detection on a single frame.
         
         Args:
-            frame: BGR or RGB image as numpy array
+            frame: BGR or RGB image as numpy array, or None to run on the
+                input buffer from get_input_buffer() (boxes are then in
+                model input coordinates)
             
         Returns:
             List of Detection objects for target classes
         """
-        if not self.model_loaded or self.model is None:
+        model = self.model
+        if not self.model_loaded or model is None:
             logger.warning("Model not loaded, skipping detection")
             return []
         
+        if __debug__:
+            self._check_detect_thread()
+        
         detections = []
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
         
         try:
-            with self._lock:
-                results = self.model(
-                    frame,
-                    conf=self.confidence_threshold,
-                    iou=self.iou_threshold,
-                    verbose=False
-                )
+            # All detections of a frame share one timestamp
+            frame_ts = time.time()
+            if frame is None:
+                frame, scale = self._input_bufs[0], (1.0, 1.0, 1.0, 1.0)
+            else:
+                frame, scale = self._prepare_frame(frame)
             
-            inference_time = (time.perf_counter() - start_time) * 1000
-            self._record_inference_time(inference_time)
+            results = model(
+                frame,
+                imgsz=self.imgsz,
+                conf=self.confidence_threshold,
+                iou=self.iou_threshold,
+                verbose=False
+            )
+            
+            inference_ns = time.monotonic_ns() - start_ns
+            self._record_inference_time(inference_ns)
             
             if results and len(results) > 0:
-                result = results[0]
-                
-                if result.boxes is not None:
-                    for box in result.boxes:
-                        class_id = int(box.cls[0])
-                        
-                        if class_id not in self.target_classes:
-                            continue
-                        
-                        confidence = float(box.conf[0])
-                        x1, y1, x2, y2 = map(int, box.xyxy[0].tolist())
-                        
-                        class_name = self.WILD_CAT_CLASSES.get(
-                            class_id, 
-                            self.model.names.get(class_id, f"class_{class_id}")
-                        )
-                        
-                        detection = Detection(
-                            class_id=class_id,
-                            class_name=class_name,
-                            confidence=confidence,
-                            bbox=(x1, y1, x2, y2),
-                            timestamp=time.time()
-                        )
-                        detections.append(detection)
-            
-            logger.debug(f"Detection completed in {inference_time:.1f}ms, found {len(detections)} wild cats")
+                detections = self._parse_result(results[0], scale, frame_ts)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Detection completed in %.1fms, found %d wild cats",
+                    inference_ns / 1e6, len(detections)
+                )
             
         except Exception as e:
             logger.error(f"Detection error: {e}")
         
         return detections
     
-    def _record_inference_time(self, time_ms: float):
+    def detect_batch(self, frames: List[np.ndarray]) -> List[List[Detection]]:
+        """
+        Run detection on several frames in one forward pass.
+        
+        Args:
+            frames: BGR or RGB images as numpy arrays
+            
+        Returns:
+            One list of Detection objects per input frame, in order
+        """
+        model = self.model
+        if not self.model_loaded or model is None:
+            logger.warning("Model not loaded, skipping detection")
+            return [[] for _ in frames]
+        
+        if __debug__:
+            self._check_detect_thread()
+        
+        batch_detections: List[List[Detection]] = [[] for _ in frames]
+        start_ns = time.monotonic_ns()
+        
+        try:
+            frame_ts = time.time()
+            prepared = [self._prepare_frame(frame, slot) for slot, frame in enumerate(frames)]
+            
+            results = model(
+                [frame for frame, _ in prepared],
+                imgsz=self.imgsz,
+                conf=self.confidence_threshold,
+                iou=self.iou_threshold,
+                verbose=False
+            )
+            
+            # Recorded per frame so the average and FPS stay comparable
+            inference_ns = time.monotonic_ns() - start_ns
+            self._record_inference_time(inference_ns // len(frames))
+            
+            for i, result in enumerate(results):
+                batch_detections[i] = self._parse_result(result, prepared[i][1], frame_ts)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Batch of %d detected in %.1fms", len(frames), inference_ns / 1e6
+                )
+            
+        except Exception as e:
+            logger.error(f"Detection error: {e}")
+        
+        return batch_detections
+    
+    def get_input_buffer(self) -> np.ndarray:
+        """
+        Model-sized (imgsz, imgsz, 3) uint8 buffer owned by the detector.
+        
+        A producer may write a frame into it directly (e.g. with
+        cv2.resize(..., dst=buffer)) and call detect() without a frame.
+        Single writer only: the buffer is also the detector's resize target,
+        so it must not be written while detect() runs.
+        """
+        return self._input_bufs[0]
+    
+    def _prepare_frame(
+        self,
+        frame: np.ndarray,
+        slot: int = 0
+    ) -> Tuple[np.ndarray, Tuple[float, ...]]:
+        """
+        Resize a frame to the model input and return the box scale back.
+        
+        Resizing up front lets Ultralytics skip its letterbox step; the
+        returned (sx, sy, sx, sy) maps boxes back to frame coordinates.
+        The resize writes into the input buffer for the given batch slot
+        instead of allocating a new array per frame.
+        """
+        height, width = frame.shape[:2]
+        if cv2 is None or (width, height) == (self.imgsz, self.imgsz):
+            return frame, (1.0, 1.0, 1.0, 1.0)
+        
+        scale_x = width / self.imgsz
+        scale_y = height / self.imgsz
+        while len(self._input_bufs) <= slot:
+            self._input_bufs.append(np.empty_like(self._input_bufs[0]))
+        
+        frame = cv2.resize(
+            frame,
+            (self.imgsz, self.imgsz),
+            dst=self._input_bufs[slot],
+            interpolation=cv2.INTER_LINEAR
+        )
+        return frame, (scale_x, scale_y, scale_x, scale_y)
+    
+    def _parse_result(
+        self,
+        result,
+        scale: Tuple[float, ...],
+        frame_ts: float
+    ) -> List[Detection]:
+        """Convert one Ultralytics result into target-class detections."""
+        boxes = result.boxes
+        if boxes is None or not len(boxes):
+            return []
+        
+        # Pull every box out of the tensors in one go and filter
+        # with the lookup table instead of converting box by box
+        cls = boxes.cls.cpu().numpy().astype(np.int32)
+        keep = self._target_lut[cls].nonzero()[0]
+        if not keep.size:
+            return []
+        
+        class_names = self._class_names
+        conf = boxes.conf.cpu().numpy()[keep]
+        xyxy = (boxes.xyxy.cpu().numpy()[keep] * scale).astype(np.int32)
+        
+        return [
+            Detection(
+                class_id=class_id,
+                class_name=class_names[class_id],
+                confidence=confidence,
+                bbox=tuple(bbox),
+                timestamp=frame_ts
+            )
+            for class_id, confidence, bbox in zip(
+                cls[keep].tolist(), conf.tolist(), xyxy.tolist()
+            )
+        ]
+    
+    def _check_detect_thread(self):
+        """
+        Enforce the single-thread invariant of detect().
+        
+        Only called under __debug__, so both recording the owning thread
+        and the check itself are skipped together under python -O.
+        """
+        ident = threading.get_ident()
+        if self._detect_thread is None:
+            self._detect_thread = ident
+        elif self._detect_thread != ident:
+            raise AssertionError("detect() called from more than one thread")
+    
+    def _record_inference_time(self, time_ns: int):
         """Record inference time for performance monitoring."""
-        self._inference_times.append(time_ms)
-        if len(self._inference_times) > self._max_inference_history:
-            self._inference_times.pop(0)
+        times = self._inference_times
+        # Keep a running sum so the average stays O(1); the deque drops
+        # the oldest sample on append once full
+        if len(times) == self._max_inference_history:
+            self._inference_sum_ns -= times[0]
+        times.append(time_ns)
+        self._inference_sum_ns += time_ns
     
     def get_average_inference_time(self) -> float:
         """Get average inference time in milliseconds."""
         if not self._inference_times:
             return 0.0
-        return sum(self._inference_times) / len(self._inference_times)
+        return self._inference_sum_ns / len(self._inference_times) / 1e6
     
     def get_fps(self) -> float:
         """Get estimated FPS based on inference time."""
@@ -207,6 +435,8 @@ class WildlifeDetector:
         return {
             "model_loaded": self.model_loaded,
             "use_ncnn": self.use_ncnn,
+            "quant": self.quant,
+            "input_size": self.imgsz,
             "avg_inference_ms": round(self.get_average_inference_time(), 2),
             "estimated_fps": round(self.get_fps(), 2),
             "target_classes": self.target_classes,
@@ -218,4 +448,5 @@ class WildlifeDetector:
         with self._lock:
             self.model = None
             self.model_loaded = False
+            self._detect_thread = None
         logger.info("Model unloaded")
@@ -3,11 +3,13 @@ Alert service for handling detection notifications.
 Supports local GPIO alerts and remote dashboard notifications.
 """
 
+import base64
 import logging
 import time
 import threading
 from typing import Optional, Dict, Any, Callable
 from dataclasses import dataclass
+from queue import Queue, Empty, Full
 
 from ..core.config import Config
 from ..api.dashboard_client import DashboardClient, SyncPayload
@@ -56,6 +58,9 @@ class AlertService:
         
         self._gpio_available = False
         self._gpio = None
+        self._gpio_queue: Queue = Queue(maxsize=10)
+        self._gpio_thread: Optional[threading.Thread] = None
+        self._gpio_stop = threading.Event()
         self._alert_count = 0
         self._last_alert_time: Dict[str, float] = {}
         self._camera_id = f"cam-{config.device.id}-0"
@@ -80,6 +85,14 @@ class AlertService:
                 initial=GPIO.LOW
             )
             self._gpio_available = True
+            
+            # Pulses are timed with sleeps, so play them off the alert path
+            self._gpio_thread = threading.Thread(
+                target=self._gpio_loop,
+                name="GPIOAlerts",
+                daemon=True
+            )
+            self._gpio_thread.start()
             logger.info(f"GPIO initialized on pin {self.config.alerts.local.gpio_pin}")
         except ImportError:
             logger.debug("RPi.GPIO not available (not running on Raspberry Pi)")
@@ -108,29 +121,41 @@ class AlertService:
             self._last_alert_time[detection.class_name] = time.time()
     
     def _trigger_local_alert(self, class_name: str, high_priority: bool = False):
-        """Trigger local GPIO alert (buzzer/LED)."""
+        """Trigger local GPIO alert (buzzer/LED) without blocking the caller."""
         if not self._gpio_available or not self._gpio:
             return
         
+        pin = self.config.alerts.local.gpio_pin
+        duration = self.config.alerts.local.buzzer_duration_ms / 1000.0
+        pulses = 3 if high_priority else 1
+        
         try:
-            pin = self.config.alerts.local.gpio_pin
-            duration = self.config.alerts.local.buzzer_duration_ms / 1000.0
+            self._gpio_queue.put_nowait((pin, pulses, duration))
+            logger.debug("Local alert triggered for %s", class_name)
+        except Full:
+            logger.debug("Local alert dropped for %s, buzzer busy", class_name)
+    
+    def _gpio_loop(self):
+        """Play queued (pin, pulses, duration) buzzer patterns until stopped."""
+        stop = self._gpio_stop
+        
+        while not stop.is_set():
+            try:
+                pin, pulses, duration = self._gpio_queue.get(timeout=0.5)
+            except Empty:
+                continue
             
-            if high_priority:
-                for _ in range(3):
+            try:
+                for i in range(pulses):
                     self._gpio.output(pin, self._gpio.HIGH)
-                    time.sleep(duration)
+                    # Waiting on the stop event cuts a pulse short on
+                    # shutdown; the pin is always driven LOW again first
+                    stopped = stop.wait(duration)
                     self._gpio.output(pin, self._gpio.LOW)
-                    time.sleep(0.1)
-            else:
-                self._gpio.output(pin, self._gpio.HIGH)
-                time.sleep(duration)
-                self._gpio.output(pin, self._gpio.LOW)
-            
-            logger.debug(f"Local alert triggered for {class_name}")
-            
-        except Exception as e:
-            logger.error(f"Local alert failed: {e}")
+                    if stopped or (i < pulses - 1 and stop.wait(0.1)):
+                        return
+            except Exception as e:
+                logger.error(f"Local alert failed: {e}")
     
     def _send_remote_alert(
         self,
@@ -143,9 +168,12 @@ class AlertService:
             return
         
         try:
+            # The legacy dashboard client only takes base64 in its JSON
             image_base64 = None
             if self.config.alerts.remote.include_image and self.image_store:
-                image_base64 = self._get_compressed_image(event.frame.data)
+                jpeg = self._get_compressed_image_bytes(event.frame.data)
+                if jpeg:
+                    image_base64 = base64.b64encode(jpeg).decode('utf-8')
             
             payload = SyncPayload(
                 detection_id=self._alert_count,
@@ -163,45 +191,20 @@ class AlertService:
                     logger.info(f"High-priority alert sent: {detection.class_name}")
             else:
                 self.dashboard_client.queue_detection(payload)
-                logger.debug(f"Alert queued: {detection.class_name}")
+                logger.debug("Alert queued: %s", detection.class_name)
                 
         except Exception as e:
             logger.error(f"Remote alert failed: {e}")
     
-    def _get_compressed_image(self, image_data) -> Optional[str]:
-        """Get compressed base64 image for transmission."""
+    def _get_compressed_image_bytes(self, image_data) -> Optional[bytes]:
+        """Get compressed JPEG bytes for transmission."""
         if not self.image_store:
             return None
         
         try:
-            import io
-            import base64
-            from PIL import Image
-            
-            img = Image.fromarray(image_data)
-            
-            max_size = self.config.alerts.remote.image_max_size_kb
-            quality = 70
-            
-            while quality > 10:
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=quality)
-                size_kb = buffer.tell() / 1024
-                
-                if size_kb <= max_size:
-                    buffer.seek(0)
-                    return base64.b64encode(buffer.read()).decode('utf-8')
-                
-                quality -= 10
-                if quality <= 30:
-                    new_size = (img.width // 2, img.height // 2)
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                    quality = 50
-            
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=20)
-            buffer.seek(0)
-            return base64.b64encode(buffer.read()).decode('utf-8')
+            return self.image_store.compress_frame(
+                image_data, self.config.alerts.remote.image_max_size_kb
+            )
             
         except Exception as e:
             logger.error(f"Image compression failed: {e}")
@@ -209,6 +212,11 @@ class AlertService:
     
     def cleanup(self):
         """Cleanup GPIO resources."""
+        # Stop the worker before releasing the pins it drives
+        self._gpio_stop.set()
+        if self._gpio_thread and self._gpio_thread.is_alive():
+            self._gpio_thread.join(timeout=5)
+        
         if self._gpio_available and self._gpio:
             try:
                 self._gpio.cleanup()
@@ -226,12 +234,7 @@ class AlertService:
             return
         
         try:
-            # Get image data for upload
-            image_data = None
-            image_base64 = None
-            
-            if self.config.alerts.remote.include_image:
-                image_base64 = self._get_compressed_image(event.frame.data)
+            include_image = self.config.alerts.remote.include_image
             
             metadata = {
                 "processing_time_ms": event.processing_time_ms,
@@ -240,7 +243,12 @@ class AlertService:
             }
             
             if high_priority:
-                # Immediate upload for high-priority detections
+                # Immediate upload for high-priority detections, so the
+                # image has to be compressed inline
+                image_data = None
+                if include_image:
+                    image_data = self._get_compressed_image_bytes(event.frame.data)
+                
                 result = self.upload_service.upload_immediate(
                     detection_id=self._alert_count,
                     class_name=detection.class_name,
@@ -248,7 +256,7 @@ class AlertService:
                     confidence=detection.confidence,
                     bbox=list(detection.bbox),
                     camera_id=self._camera_id,
-                    image_base64=image_base64,
+                    image_data=image_data,
                     metadata=metadata
                 )
                 if result.success:
@@ -256,7 +264,8 @@ class AlertService:
                 else:
                     logger.warning(f"High-priority upload queued for retry: {detection.class_name}")
             else:
-                # Queue for batch upload
+                # Queue for batch upload; the raw frame is handed over as-is
+                # and compressed on the upload service's worker thread
                 event_id = self.upload_service.queue_detection(
                     detection_id=self._alert_count,
                     class_name=detection.class_name,
@@ -265,11 +274,15 @@ class AlertService:
                     bbox=list(detection.bbox),
                     camera_id=self._camera_id,
                     image_path=None,
-                    image_data=image_base64.encode() if image_base64 else None,
+                    frame=event.frame.data if include_image else None,
+                    compress_spec={
+                        "max_kb": self.config.alerts.remote.image_max_size_kb,
+                        "quality": 70
+                    },
                     priority=5 if detection.class_name in self.HIGH_PRIORITY_CLASSES else 0,
                     metadata=metadata
                 )
-                logger.debug(f"Detection queued for upload: {event_id}")
+                logger.debug("Detection queued for upload: %s", event_id)
                 
         except Exception as e:
             logger.error(f"Failed to upload detection: {e}")
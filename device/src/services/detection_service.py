@@ -118,7 +118,8 @@ class DetectionService:
                 iou_threshold=self.config.detection.model.iou_threshold,
                 target_classes=self.config.detection.target_classes,
                 use_ncnn=self.config.detection.use_ncnn,
-                num_threads=self.config.detection.num_threads
+                num_threads=self.config.detection.num_threads,
+                input_size=self.config.detection.input_size
             )
             if not self.detector.load_model():
                 raise RuntimeError("Model loading failed")
@@ -209,6 +210,14 @@ class DetectionService:
         """Main capture loop running in separate thread."""
         frame_interval = 1.0 / self.config.camera.fps
         
+        # Frames are run through the model batch_size at a time; a partial
+        # batch is flushed when the camera stalls or its oldest frame has
+        # waited a full batch interval. One left at shutdown is dropped, as
+        # the processing loop would no longer handle its events
+        batch_size = max(1, self.config.detection.batch_size)
+        batch_wait = frame_interval * batch_size
+        pending: List[CameraFrame] = []
+        
         while not self._stop_event.is_set():
             loop_start = time.perf_counter()
             
@@ -218,8 +227,22 @@ class DetectionService:
                     
                     if frame:
                         self._frame_count += 1
-                        self._process_frame(frame)
+                        if batch_size == 1:
+                            self._process_frame(frame)
+                        else:
+                            pending.append(frame)
+                    
+                    if pending and (
+                        len(pending) >= batch_size
+                        or not frame
+                        or time.time() - pending[0].timestamp >= batch_wait
+                    ):
+                        self._process_frames(pending)
+                        pending = []
                 else:
+                    if pending:
+                        self._process_frames(pending)
+                        pending = []
                     time.sleep(0.1)
                 
             except Exception as e:
@@ -240,25 +263,47 @@ class DetectionService:
             detections = self.detector.detect(frame.data)
             
             processing_time = (time.perf_counter() - start_time) * 1000
+            self._queue_detections(frame, detections, processing_time)
             
-            filtered_detections = self._apply_cooldown(detections)
+        except Exception as e:
+            logger.error(f"Frame processing error: {e}")
+    
+    def _process_frames(self, frames: List[CameraFrame]):
+        """Process several frames for detections in one batched inference."""
+        start_time = time.perf_counter()
+        
+        try:
+            batch_detections = self.detector.detect_batch([frame.data for frame in frames])
+            
+            processing_time = (time.perf_counter() - start_time) * 1000 / len(frames)
+            for frame, detections in zip(frames, batch_detections):
+                self._queue_detections(frame, detections, processing_time)
             
-            if filtered_detections:
-                event = DetectionEvent(
-                    frame=frame,
-                    detections=filtered_detections,
-                    processing_time_ms=processing_time,
-                    timestamp=time.time()
-                )
-                
-                try:
-                    self._detection_queue.put_nowait(event)
-                except:
-                    logger.warning("Detection queue full, dropping event")
-                
         except Exception as e:
             logger.error(f"Frame processing error: {e}")
     
+    def _queue_detections(
+        self,
+        frame: CameraFrame,
+        detections: List[Detection],
+        processing_time: float
+    ):
+        """Apply the cooldown and queue a detection event for the frame."""
+        filtered_detections = self._apply_cooldown(detections)
+        
+        if filtered_detections:
+            event = DetectionEvent(
+                frame=frame,
+                detections=filtered_detections,
+                processing_time_ms=processing_time,
+                timestamp=time.time()
+            )
+            
+            try:
+                self._detection_queue.put_nowait(event)
+            except:
+                logger.warning("Detection queue full, dropping event")
+    
     def _apply_cooldown(self, detections: List[Detection]) -> List[Detection]:
         """Filter detections based on cooldown period."""
         cooldown = self.config.alerts.cooldown_seconds
@@ -8,9 +8,9 @@ import time
 import threading
 import uuid
 import io
-import base64
 from typing import Optional, Dict, Any, List, Callable
 from dataclasses import dataclass
+from queue import Queue, Empty, Full
 
 from ..storage.offline_queue import OfflineQueue, DetectionEventPayload
 from ..storage.image_store import ImageStore
@@ -66,6 +66,12 @@ class UploadService:
         
         self._stop_event = threading.Event()
         self._upload_thread: Optional[threading.Thread] = None
+        
+        # Raw frames waiting to be compressed before they are queued
+        self._compress_queue: Queue = Queue(maxsize=20)
+        self._compress_thread: Optional[threading.Thread] = None
+        # Serializes hand-off to the compressor against stop()
+        self._compress_lock = threading.Lock()
         self._http_client = None
         
         # Stats
@@ -117,13 +123,41 @@ class UploadService:
         ).hexdigest()
         return signature
     
+    @staticmethod
+    def _encode_multipart(metadata: str, image: bytes) -> tuple:
+        """
+        Encode JSON metadata plus a raw JPEG as multipart/form-data.
+        
+        Returns:
+            Tuple of (body, content_type)
+        """
+        boundary = uuid.uuid4().hex
+        body = b"".join((
+            f"--{boundary}\r\n".encode(),
+            b'Content-Disposition: form-data; name="metadata"; filename="metadata.json"\r\n',
+            b"Content-Type: application/json\r\n\r\n",
+            metadata.encode(),
+            f"\r\n--{boundary}\r\n".encode(),
+            b'Content-Disposition: form-data; name="image"; filename="detection.jpg"\r\n',
+            b"Content-Type: image/jpeg\r\n\r\n",
+            image,
+            f"\r\n--{boundary}--\r\n".encode(),
+        ))
+        return body, f"multipart/form-data; boundary={boundary}"
+    
     def _make_request(
         self,
         endpoint: str,
         data: Dict[str, Any],
-        timeout: int = 60
+        timeout: int = 60,
+        image: Optional[bytes] = None
     ) -> Optional[Dict[str, Any]]:
-        """Make HTTP request to the portal API."""
+        """
+        Make HTTP request to the portal API.
+        
+        When image is given it is sent as a raw multipart part next to the
+        JSON metadata instead of being base64-encoded into the JSON.
+        """
         import json
         
         http = self._get_http_client()
@@ -135,8 +169,13 @@ class UploadService:
         payload = json.dumps(data)
         signature = self._generate_signature(payload, timestamp)
         
+        if image:
+            body, content_type = self._encode_multipart(payload, image)
+        else:
+            body, content_type = payload.encode(), "application/json"
+        
         headers = {
-            "Content-Type": "application/json",
+            "Content-Type": content_type,
             "X-API-Key": self.api_key,
             "X-Device-ID": self.device_id,
             "X-Timestamp": str(timestamp),
@@ -149,7 +188,7 @@ class UploadService:
             
             req = urllib.request.Request(
                 url,
-                data=payload.encode(),
+                data=body,
                 headers=headers,
                 method="POST"
             )
@@ -169,13 +208,21 @@ class UploadService:
             return None
     
     def start(self):
-        """Start the upload service background thread."""
+        """Start the upload service background threads."""
         if not self.api_url or not self.api_key:
+            # queue_detection compresses inline while no compressor runs
             logger.warning("Upload service not configured, running in offline mode")
             return
         
         self._stop_event.clear()
         
+        self._compress_thread = threading.Thread(
+            target=self._compress_loop,
+            name="UploadCompressor",
+            daemon=True
+        )
+        self._compress_thread.start()
+        
         self._upload_thread = threading.Thread(
             target=self._upload_loop,
             name="UploadService",
@@ -187,11 +234,16 @@ class UploadService:
     
     def stop(self):
         """Stop the upload service."""
-        self._stop_event.set()
+        # Once set under the lock, no further frames reach the compressor
+        with self._compress_lock:
+            self._stop_event.set()
         
         if self._upload_thread and self._upload_thread.is_alive():
             self._upload_thread.join(timeout=10)
         
+        if self._compress_thread and self._compress_thread.is_alive():
+            self._compress_thread.join(timeout=10)
+        
         logger.info("Upload service stopped")
     
     def _upload_loop(self):
@@ -208,6 +260,83 @@ class UploadService:
             
             self._stop_event.wait(self.upload_interval)
     
+    def _compress_loop(self):
+        """Background loop compressing queued frames into the offline queue."""
+        # Drain what is left on stop so queued detections are not lost
+        while not (self._stop_event.is_set() and self._compress_queue.empty()):
+            try:
+                payload, priority, frame, compress_spec = self._compress_queue.get(
+                    timeout=1.0
+                )
+            except Empty:
+                continue
+            
+            image_data = self._compress_for_upload(frame, compress_spec)
+            try:
+                self._enqueue(payload, priority, image_data)
+            except Exception as e:
+                logger.error(f"Failed to queue compressed detection: {e}")
+    
+    def _compress_for_upload(
+        self,
+        frame,
+        compress_spec: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
+        """Compress a raw RGB frame to JPEG bytes for upload."""
+        if not self.image_store:
+            return None
+        
+        spec = compress_spec or {}
+        try:
+            return self.image_store.compress_frame(
+                frame,
+                spec.get("max_kb", self.max_image_size_kb),
+                spec.get("quality", 70)
+            )
+            
+        except Exception as e:
+            # Queue the detection without an image rather than lose it
+            logger.error(f"Image compression failed: {e}")
+            return None
+    
+    def _hand_off_to_compressor(
+        self,
+        payload: DetectionEventPayload,
+        priority: int,
+        frame,
+        compress_spec: Optional[Dict[str, Any]]
+    ) -> bool:
+        """
+        Pass a frame to the compressor thread.
+        
+        Returns False when the caller has to compress inline: the
+        compressor is not running, is stopping, or its queue is full.
+        """
+        with self._compress_lock:
+            if self._stop_event.is_set():
+                return False
+            if not (self._compress_thread and self._compress_thread.is_alive()):
+                return False
+            try:
+                self._compress_queue.put_nowait((payload, priority, frame, compress_spec))
+                return True
+            except Full:
+                # Backpressure: compress on the caller rather than drop the image
+                logger.warning(
+                    "Compression queue full, compressing %s inline", payload.event_id
+                )
+                return False
+    
+    def _enqueue(
+        self,
+        payload: DetectionEventPayload,
+        priority: int,
+        image_data: Optional[bytes]
+    ):
+        """Persist a detection into the offline queue."""
+        if self.offline_queue:
+            self.offline_queue.enqueue(payload, priority=priority, image_data=image_data)
+    
     def _process_queue(self):
         """Process pending items from the offline queue."""
         if not self.offline_queue:
@@ -260,11 +389,10 @@ class UploadService:
         if self.event_logger:
             self.event_logger.log_upload_started(event_id)
         
-        # Prepare image data
+        # Prepare image data; raw JPEG bytes go out as a multipart part
+        image_data = item.get('image_data')
         image_base64 = None
-        if item.get('image_data'):
-            image_base64 = base64.b64encode(item['image_data']).decode('utf-8')
-        elif item.get('image_path') and self.image_store:
+        if not image_data and item.get('image_path') and self.image_store:
             image_base64 = self.image_store.get_image_base64(
                 item['image_path'],
                 max_size_kb=self.max_image_size_kb
@@ -291,7 +419,7 @@ class UploadService:
         }
         
         # Send to portal
-        response = self._make_request("/devices/detections", payload)
+        response = self._make_request("/devices/detections", payload, image=image_data)
         
         if response:
             return UploadResult(
@@ -317,11 +445,17 @@ class UploadService:
         image_path: Optional[str] = None,
         image_data: Optional[bytes] = None,
         priority: int = 0,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        frame=None,
+        compress_spec: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Queue a detection event for upload.
         
+        A raw RGB frame can be passed instead of image_data; it is
+        compressed according to compress_spec ({"max_kb", "quality"}) on
+        the compressor thread so the caller is not blocked by encoding.
+        
         Returns:
             Event ID for tracking
         """
@@ -342,8 +476,10 @@ class UploadService:
             metadata=metadata or {}
         )
         
-        if self.offline_queue:
-            self.offline_queue.enqueue(payload, priority=priority, image_data=image_data)
+        if frame is None:
+            self._enqueue(payload, priority, image_data)
+        elif not self._hand_off_to_compressor(payload, priority, frame, compress_spec):
+            self._enqueue(payload, priority, self._compress_for_upload(frame, compress_spec))
         
         if self.event_logger:
             self.event_logger.log_detection(
@@ -389,10 +525,6 @@ class UploadService:
             )
             self.event_logger.log_upload_started(event_id)
         
-        # Prepare image
-        if image_data and not image_base64:
-            image_base64 = base64.b64encode(image_data).decode('utf-8')
-        
         payload = {
             "event_id": event_id,
             "detection_id": detection_id,
@@ -413,7 +545,11 @@ class UploadService:
             }
         }
         
-        response = self._make_request("/devices/detections", payload)
+        response = self._make_request(
+            "/devices/detections",
+            payload,
+            image=image_data if not image_base64 else None
+        )
         
         if response:
             self._upload_success += 1
@@ -7,6 +7,7 @@ import logging
 import time
 import io
 import os
+import math
 import base64
 from pathlib import Path
 from typing import Optional, Tuple
@@ -146,15 +147,18 @@ class ImageStore:
             
             img = Image.open(full_path)
             
+            # One buffer reused across encodes, rewound before each attempt
+            buffer = io.BytesIO()
+            
             quality = self.jpeg_quality
             while quality > 10:
-                buffer = io.BytesIO()
+                buffer.seek(0)
+                buffer.truncate(0)
                 img.save(buffer, format="JPEG", quality=quality)
                 size_kb = buffer.tell() / 1024
                 
                 if size_kb <= max_size_kb:
-                    buffer.seek(0)
-                    return base64.b64encode(buffer.read()).decode('utf-8')
+                    return base64.b64encode(buffer.getbuffer()).decode('utf-8')
                 
                 quality -= 10
                 
@@ -163,15 +167,111 @@ class ImageStore:
                     img = img.resize(new_size, Image.Resampling.LANCZOS)
                     quality = 50
             
-            buffer = io.BytesIO()
-            img.save(buffer, format="JPEG", quality=20)
             buffer.seek(0)
-            return base64.b64encode(buffer.read()).decode('utf-8')
+            buffer.truncate(0)
+            img.save(buffer, format="JPEG", quality=20)
+            return base64.b64encode(buffer.getbuffer()).decode('utf-8')
             
         except Exception as e:
             logger.error(f"Failed to get image as base64: {e}")
             return None
     
+    # Quality steps searched when compressing frames for upload
+    JPEG_QUALITY_STEPS = (10, 20, 30, 40, 50, 60, 70, 80, 90)
+    # Rough JPEG size of a camera frame at the starting quality
+    JPEG_BYTES_PER_PIXEL = 0.25
+    
+    def compress_frame(
+        self,
+        image: np.ndarray,
+        max_size_kb: float,
+        quality: int = 70
+    ) -> bytes:
+        """
+        Compress an RGB frame to a JPEG no larger than max_size_kb.
+        
+        Uses OpenCV (libjpeg-turbo). The frame is first downscaled to the
+        estimated size budget and encoded at the given quality; only if
+        that misses are the lower quality steps binary-searched, halving
+        the frame once if even the lowest step is too big.
+        
+        Returns:
+            JPEG bytes
+        """
+        import cv2
+        
+        # Frames are RGB, OpenCV encodes BGR
+        img = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        
+        # Encode time is roughly linear in pixels, so shrink the frame to
+        # the estimated size budget before the first encode
+        height, width = img.shape[:2]
+        scale = math.sqrt(
+            max_size_kb * 1024 / (height * width * self.JPEG_BYTES_PER_PIXEL)
+        )
+        if scale < 0.95:
+            img = cv2.resize(
+                img, (int(width * scale), int(height * scale)),
+                interpolation=cv2.INTER_AREA
+            )
+        
+        buffer = self._search_jpeg_quality(img, max_size_kb, quality)
+        if buffer is None:
+            height, width = img.shape[:2]
+            img = cv2.resize(
+                img, (width // 2, height // 2), interpolation=cv2.INTER_AREA
+            )
+            buffer = self._search_jpeg_quality(img, max_size_kb, quality)
+        if buffer is None:
+            buffer, _ = self._encode_jpeg(img, self.JPEG_QUALITY_STEPS[0])
+        
+        return buffer.tobytes()
+    
+    def _search_jpeg_quality(
+        self,
+        img: np.ndarray,
+        max_size_kb: float,
+        quality: int
+    ):
+        """
+        Find the highest quality, up to the given one, whose JPEG fits.
+        
+        Encodes at quality first, which usually fits; on a miss the quality
+        steps below it are binary-searched. Returns the encoded buffer, or
+        None if even the lowest step is too big.
+        """
+        buffer, size_kb = self._encode_jpeg(img, quality)
+        if size_kb <= max_size_kb:
+            return buffer
+        
+        steps = [step for step in self.JPEG_QUALITY_STEPS if step < quality]
+        lo, hi = 0, len(steps) - 1
+        best = None
+        
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            buffer, size_kb = self._encode_jpeg(img, steps[mid])
+            if size_kb <= max_size_kb:
+                best = buffer
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        
+        return best
+    
+    @staticmethod
+    def _encode_jpeg(img: np.ndarray, quality: int):
+        """Encode a BGR frame as JPEG, returning (buffer, size_kb)."""
+        import cv2
+        
+        ok, buffer = cv2.imencode(
+            ".jpg", img,
+            [cv2.IMWRITE_JPEG_QUALITY, quality, cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+        )
+        if not ok:
+            raise RuntimeError(f"JPEG encoding failed at quality {quality}")
+        return buffer, buffer.nbytes / 1024
+    
     def cleanup_old_images(self) -> Tuple[int, float]:
         """
         Remove images older than cleanup_days.